@@ -8,11 +8,30 @@ through the proper architectural layers:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 # Metadata
 from .__init__conf__ import print_info
 
-# Composition exports (wired adapters)
-from .composition import get_config
+if TYPE_CHECKING:
+    from .composition import get_config
+
+
+def __getattr__(name: str) -> Any:
+    """Import the composition layer on first access to ``get_config`` (PEP 562).
+
+    Keeps ``import bmk`` free of the configuration and logging stack, so the
+    ``--version`` fast path in :mod:`bmk.entry` imports neither.
+
+    Raises:
+        AttributeError: If *name* is not a lazily exported attribute.
+    """
+    if name == "get_config":
+        from .composition import get_config
+
+        return get_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "get_config",
@@ -12,14 +12,47 @@ Contents:
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True, slots=True)
-class ToolCheck:
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Final, NamedTuple
+
+_MAX_PROBE_WORKERS = 8
+
+_REPORT_HEADER: Final[str] = "Prerequisites:"
+
+#: ``(tool name, install hint)`` pair checked on PATH.
+_ToolSpec = tuple[str, str]
+
+#: Tool specs per platform, built once at import. macOS and Linux differ only
+#: in their hints; the platform itself is read per call by :func:`_is_macos`.
+_LINUX_TOOL_SPECS: Final[tuple[_ToolSpec, ...]] = (
+    ("git", "sudo apt install git"),
+    ("pwsh", "https://learn.microsoft.com/en-us/powershell/scripting/install/installing-powershell-on-linux"),
+    ("shellcheck", "sudo apt install shellcheck"),
+    ("shfmt", "sudo apt install shfmt"),
+    ("bashate", "pip install bashate"),
+)
+
+_MACOS_TOOL_SPECS: Final[tuple[_ToolSpec, ...]] = (
+    ("git", "brew install git"),
+    ("pwsh", "brew install powershell/tap/powershell"),
+    ("shellcheck", "brew install shellcheck"),
+    ("shfmt", "brew install shfmt"),
+    ("bashate", "pip install bashate"),
+)
+
+_WINDOWS_TOOL_SPECS: Final[tuple[_ToolSpec, ...]] = (
+    ("winget", 'Pre-installed on Windows 11. For Windows 10: install "App Installer" from the Microsoft Store'),
+    ("git", "winget install Git.Git"),
+    ("pwsh", "winget install Microsoft.PowerShell"),
+)
+
+
+class ToolCheck(NamedTuple):
     """Result of checking whether a single external tool is available."""
 
     name: str
@@ -31,88 +64,99 @@ def _is_macos() -> bool:
     return sys.platform == "darwin"
 
 
-def _check_tool_on_path(name: str) -> bool:
-    return shutil.which(name) is not None
+def _check_tool_on_path(name: str) -> str | None:
+    """Return the resolved path of *name* on ``PATH``, or None if absent."""
+    return shutil.which(name)
+
+
+def _psmodule_dirs(pwsh_path: str) -> list[Path]:
+    """Return directories PowerShell searches for modules.
+
+    Uses ``PSModulePath`` when set; otherwise falls back to ``$PSHOME/Modules``
+    (next to the pwsh binary) plus the default user and system locations.
+    """
+    module_path = os.environ.get("PSModulePath")  # noqa: SIM112 - the name pwsh exports (case-sensitive on POSIX)
+    if module_path:
+        return [Path(entry) for entry in module_path.split(os.pathsep) if entry]
+    home = Path.home()
+    return [
+        Path(pwsh_path).resolve().parent / "Modules",
+        home / "Documents" / "PowerShell" / "Modules",
+        home / ".local" / "share" / "powershell" / "Modules",
+        Path("/usr/local/share/powershell/Modules"),
+        Path(r"C:\Program Files\PowerShell\Modules"),
+    ]
+
+
+def _check_psscriptanalyzer_fast(pwsh_path: str) -> bool:
+    """Detect PSScriptAnalyzer by looking for its folder in the module directories."""
+    return any((directory / "PSScriptAnalyzer").is_dir() for directory in _psmodule_dirs(pwsh_path))
 
 
 def _check_psscriptanalyzer(pwsh_path: str) -> bool:
-    """Check if PSScriptAnalyzer PowerShell module is available."""
+    """Check if PSScriptAnalyzer PowerShell module is available.
+
+    Tries the filesystem scan first; only when that finds nothing is a pwsh
+    interpreter launched, since pwsh may know module paths we do not.
+    """
+    if _check_psscriptanalyzer_fast(pwsh_path):
+        return True
     try:
         result = subprocess.run(  # noqa: S603
             [pwsh_path, "-NoProfile", "-Command", "Get-Module -ListAvailable PSScriptAnalyzer"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
             timeout=15,
         )
-        return result.returncode == 0 and "PSScriptAnalyzer" in result.stdout
+        return result.returncode == 0 and b"PSScriptAnalyzer" in result.stdout
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 
-def _append_psscriptanalyzer_check(results: list[ToolCheck]) -> None:
-    """Check PSScriptAnalyzer availability and append result to the list.
+def _probe_pwsh() -> tuple[str | None, bool]:
+    """Locate pwsh and, when found, probe PSScriptAnalyzer in the same task.
 
-    Only probes the module when pwsh is already found in *results*.
+    Returns:
+        The pwsh path (or None) and whether PSScriptAnalyzer is available.
     """
-    pwsh_result = next(r for r in results if r.name == "pwsh")
-    if pwsh_result.found:
-        pwsh_path = shutil.which("pwsh") or "pwsh"
-        found = _check_psscriptanalyzer(pwsh_path)
-    else:
-        found = False
-    results.append(
-        ToolCheck(
-            name="PSScriptAnalyzer",
-            found=found,
-            install_hint="Install-Module PSScriptAnalyzer -Force -Scope CurrentUser (requires pwsh)",
-        )
+    pwsh_path = _check_tool_on_path("pwsh")
+    return pwsh_path, pwsh_path is not None and _check_psscriptanalyzer(pwsh_path)
+
+
+def _psscriptanalyzer_result(found: bool) -> ToolCheck:
+    return ToolCheck(
+        name="PSScriptAnalyzer",
+        found=found,
+        install_hint="Install-Module PSScriptAnalyzer -Force -Scope CurrentUser (requires pwsh)",
     )
 
 
-def _posix_tools() -> list[ToolCheck]:
-    macos = _is_macos()
-    tools: list[tuple[str, str]] = [
-        ("git", "brew install git" if macos else "sudo apt install git"),
-        (
-            "pwsh",
-            "brew install powershell/tap/powershell"
-            if macos
-            else "https://learn.microsoft.com/en-us/powershell/scripting/install/installing-powershell-on-linux",
-        ),
-        ("shellcheck", "brew install shellcheck" if macos else "sudo apt install shellcheck"),
-        ("shfmt", "brew install shfmt" if macos else "sudo apt install shfmt"),
-        ("bashate", "pip install bashate"),
-    ]
-    results: list[ToolCheck] = []
-    for name, hint in tools:
-        results.append(ToolCheck(name=name, found=_check_tool_on_path(name), install_hint=hint))
-    _append_psscriptanalyzer_check(results)
+def _probe_tools(specs: tuple[_ToolSpec, ...]) -> list[ToolCheck]:
+    """Check each ``(name, install_hint)`` spec on PATH, then PSScriptAnalyzer.
+
+    Probes are I/O-bound and independent, so they run on a thread pool; the
+    slow pwsh module probe overlaps with the remaining PATH lookups. The
+    ``pwsh`` lookup is reused for that probe, so PATH is walked once per tool.
+    """
+    with ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(specs))) as executor:
+        pwsh_future = executor.submit(_probe_pwsh)
+        path_futures = {name: executor.submit(_check_tool_on_path, name) for name, _ in specs if name != "pwsh"}
+        pwsh_path, psscriptanalyzer_found = pwsh_future.result()
+        paths = {name: future.result() for name, future in path_futures.items()}
+    paths["pwsh"] = pwsh_path
+
+    results = [ToolCheck(name=name, found=paths[name] is not None, install_hint=hint) for name, hint in specs]
+    results.append(_psscriptanalyzer_result(psscriptanalyzer_found))
     return results
 
 
+def _posix_tools() -> list[ToolCheck]:
+    return _probe_tools(_MACOS_TOOL_SPECS if _is_macos() else _LINUX_TOOL_SPECS)
+
+
 def _windows_tools() -> list[ToolCheck]:
-    results: list[ToolCheck] = [
-        ToolCheck(
-            name="winget",
-            found=_check_tool_on_path("winget"),
-            install_hint=(
-                'Pre-installed on Windows 11. For Windows 10: install "App Installer" from the Microsoft Store'
-            ),
-        ),
-        ToolCheck(
-            name="git",
-            found=_check_tool_on_path("git"),
-            install_hint="winget install Git.Git",
-        ),
-        ToolCheck(
-            name="pwsh",
-            found=_check_tool_on_path("pwsh"),
-            install_hint="winget install Microsoft.PowerShell",
-        ),
-    ]
-    _append_psscriptanalyzer_check(results)
-    return results
+    return _probe_tools(_WINDOWS_TOOL_SPECS)
 
 
 def check_prerequisites() -> list[ToolCheck]:
@@ -124,13 +168,13 @@ def check_prerequisites() -> list[ToolCheck]:
 
 def format_prerequisites_report(results: list[ToolCheck]) -> str:
     """Format check results as a human-readable summary."""
-    lines = ["Prerequisites:"]
-    for tool in results:
-        if tool.found:
-            lines.append(f"  \u2713 {tool.name}")
-        else:
-            lines.append(f"  \u2717 {tool.name} \u2014 not found")
-            lines.append(f"      Install: {tool.install_hint}")
+    lines = [_REPORT_HEADER]
+    lines.extend(
+        f"  \u2713 {tool.name}"
+        if tool.found
+        else f"  \u2717 {tool.name} \u2014 not found\n      Install: {tool.install_hint}"
+        for tool in results
+    )
     return "\n".join(lines)
 
 
@@ -4,24 +4,55 @@ Internal module (underscore prefix) providing common patterns used across
 multiple command implementations.
 
 Contents:
+    * :data:`SCRIPT_NAME` - OS-appropriate stagerunner name, fixed at import.
+    * :data:`BUNDLED_DIR` - Bundled makescripts directory, resolved at import.
     * :func:`normalize_returncode` - Convert signal codes to POSIX 128+N.
     * :func:`get_script_name` - Return OS-appropriate stagerunner name.
+    * :func:`is_bundled_script` - Check the bundled makescripts directory listing.
     * :func:`resolve_script_path` - Find script in local override or bundled location.
     * :func:`execute_script` - Execute script with BMK environment variables.
     * :func:`require_script_path` - Resolve script path or exit with FILE_NOT_FOUND.
+    * :func:`run_stagerunner` - Resolve and run the stagerunner, exiting on failure.
+    * :func:`make_script_command` - Build an argument-less stagerunner command from a spec.
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, Final
 
+import lib_log_rich.runtime
 import rich_click as click
 
+from ..constants import CLICK_CONTEXT_SETTINGS
 from ..exit_codes import ExitCode
 
+logger = logging.getLogger(__name__)
+
+
+def _script_name_for_platform(platform: str) -> str:
+    """Return the stagerunner script name for a ``sys.platform`` value."""
+    return "_btx_stagerunner.ps1" if platform == "win32" else "_btx_stagerunner.sh"
+
+
+#: Stagerunner script name for the running platform (constant per process).
+SCRIPT_NAME: Final[str] = _script_name_for_platform(sys.platform)
+
+#: Bundled makescripts directory (from _shared.py: commands -> cli -> adapters -> bmk).
+BUNDLED_DIR: Final[Path] = Path(__file__).resolve().parent.parent.parent.parent / "makescripts"
+
+#: Interpreter exported to scripts as BMK_PYTHON_CMD.
+_BMK_PYTHON_CMD: Final[str] = sys.executable
+
+#: Launcher arguments placed before a ``.ps1`` stagerunner path.
+_PWSH_PREFIX: Final[tuple[str, ...]] = ("pwsh", "-NoProfile", "-NonInteractive", "-File")
+
 
 def normalize_returncode(code: int) -> int:
     """Convert negative signal return codes to POSIX 128+N convention.
@@ -35,18 +66,41 @@ def normalize_returncode(code: int) -> int:
     Returns:
         POSIX-conventional exit code.
     """
-    if code < 0:
-        return 128 + abs(code)
-    return code
+    return code if code >= 0 else 128 - code
 
 
 def get_script_name() -> str:
     """Return OS-appropriate script name.
 
+    Thin wrapper around :data:`SCRIPT_NAME`, which is computed once at import.
+
     Returns:
         ``_btx_stagerunner.ps1`` on Windows, ``_btx_stagerunner.sh`` otherwise.
     """
-    return "_btx_stagerunner.ps1" if sys.platform == "win32" else "_btx_stagerunner.sh"
+    return SCRIPT_NAME
+
+
+@functools.cache
+def _bundled_script_names() -> frozenset[str]:
+    """Return the file names in :data:`BUNDLED_DIR`, read once per process.
+
+    The bundled directory ships with the package and does not change while
+    bmk runs, so one directory scan replaces a ``stat`` per lookup.
+    """
+    try:
+        with os.scandir(BUNDLED_DIR) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+def is_bundled_script(script_name: str) -> bool:
+    """Return whether *script_name* is a file in the bundled makescripts directory.
+
+    Args:
+        script_name: Name of the script file (e.g., ``_btx_stagerunner.sh``).
+    """
+    return script_name in _bundled_script_names()
 
 
 def resolve_script_path(script_name: str, cwd: Path) -> Path | None:
@@ -63,10 +117,8 @@ def resolve_script_path(script_name: str, cwd: Path) -> Path | None:
     if local_script.is_file():
         return local_script
 
-    # Path from _shared.py up to bmk package: commands -> cli -> adapters -> bmk
-    bundled_script = Path(__file__).parent.parent.parent.parent / "makescripts" / script_name
-    if bundled_script.is_file():
-        return bundled_script
+    if is_bundled_script(script_name):
+        return BUNDLED_DIR / script_name
 
     return None
 
@@ -101,12 +153,13 @@ def execute_script(
     Returns:
         Exit code from the script execution.
     """
-    env = os.environ.copy()
-    env["BMK_PROJECT_DIR"] = str(cwd)
-    env["BMK_COMMAND_PREFIX"] = command_prefix
-    env["BMK_SHOW_WARNINGS"] = "1" if show_warnings else "0"
-    env["BMK_PYTHON_CMD"] = sys.executable
-    env["BMK_OUTPUT_FORMAT"] = output_format
+    env = os.environ | {
+        "BMK_PROJECT_DIR": os.fspath(cwd),
+        "BMK_COMMAND_PREFIX": command_prefix,
+        "BMK_SHOW_WARNINGS": "1" if show_warnings else "0",
+        "BMK_PYTHON_CMD": _BMK_PYTHON_CMD,
+        "BMK_OUTPUT_FORMAT": output_format,
+    }
 
     # Point tools at the target project's venv, not bmk's own (uvx) venv.
     # Tools like pyright and pip-audit use VIRTUAL_ENV for environment resolution.
@@ -132,17 +185,8 @@ def execute_script(
     if package_name:
         env["BMK_PACKAGE_NAME"] = str(package_name)
 
-    if script_path.suffix == ".ps1":
-        cmd = [
-            "pwsh",
-            "-NoProfile",
-            "-NonInteractive",
-            "-File",
-            str(script_path),
-            *extra_args,
-        ]
-    else:
-        cmd = [str(script_path), *extra_args]
+    script = os.fspath(script_path)
+    cmd = [*_PWSH_PREFIX, script, *extra_args] if script_path.suffix == ".ps1" else [script, *extra_args]
 
     result = subprocess.run(cmd, check=False, env=env)  # noqa: S603
     return normalize_returncode(result.returncode)
@@ -170,18 +214,94 @@ def require_script_path(script_name: str, cwd: Path, command_label: str) -> Path
     if script_path is not None:
         return script_path
 
-    click.echo(f"Error: {command_label} script '{script_name}' not found", err=True)
-    click.echo("Searched locations:", err=True)
-    click.echo(f"  - {cwd / 'bmk_makescripts' / script_name}", err=True)
-    bundled = Path(__file__).parent.parent.parent / "makescripts" / script_name
-    click.echo(f"  - {bundled}", err=True)
+    click.echo(
+        f"Error: {command_label} script '{script_name}' not found\n"
+        "Searched locations:\n"
+        f"  - {cwd / 'bmk_makescripts' / script_name}\n"
+        f"  - {BUNDLED_DIR / script_name}",
+        err=True,
+    )
     raise SystemExit(ExitCode.FILE_NOT_FOUND)
 
 
+def run_stagerunner(
+    command_label: str,
+    command_prefix: str,
+    args: tuple[str, ...] = (),
+    *,
+    execute: Callable[..., int],
+    **options: Any,
+) -> None:
+    """Run the stagerunner for *command_prefix* in the current directory.
+
+    The resolve -> execute -> exit-on-failure sequence shared by the
+    stagerunner-backed commands. *execute* is passed by each command module
+    (its own ``execute_script`` reference) so the executor stays patchable
+    per module.
+
+    Args:
+        command_label: Human-readable label for error messages (e.g. "Build").
+        command_prefix: Stage prefix exported as ``BMK_COMMAND_PREFIX``.
+        args: Arguments forwarded to the scripts.
+        execute: Script executor, normally :func:`execute_script`.
+        **options: Further keyword arguments for *execute* (e.g. ``output_format``).
+
+    Raises:
+        SystemExit: With FILE_NOT_FOUND (2) if the script is not found,
+            or the script's exit code on failure.
+    """
+    cwd = Path.cwd()
+    script_path = require_script_path(SCRIPT_NAME, cwd, command_label)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing %s script: %s with prefix %s", command_label.lower(), script_path, command_prefix)
+    exit_code = execute(script_path, cwd, args, command_prefix=command_prefix, **options)
+
+    if exit_code != 0:
+        raise SystemExit(exit_code)
+
+
+def make_script_command(
+    name: str,
+    help_text: str,
+    run: Callable[[], None],
+    *,
+    job_id: str,
+    log_message: str,
+    command_logger: logging.Logger,
+) -> click.Command:
+    """Create an argument-less Click command that logs and calls *run*.
+
+    Used by command modules that describe a command and its aliases as a
+    spec table instead of one decorated function per name.
+
+    Args:
+        name: CLI command name (e.g. "clean", "cln").
+        help_text: Help string displayed by ``--help``.
+        run: Module-level runner executing the stagerunner script.
+        job_id: ``job_id`` bound into the logging context.
+        log_message: Info message logged before *run* is called.
+        command_logger: Logger of the defining command module.
+    """
+
+    @click.command(name, context_settings=CLICK_CONTEXT_SETTINGS, help=help_text)
+    def _cmd() -> None:
+        with lib_log_rich.runtime.bind(job_id=job_id):
+            command_logger.info(log_message)
+            run()
+
+    return _cmd
+
+
 __all__ = [
+    "BUNDLED_DIR",
+    "SCRIPT_NAME",
     "execute_script",
     "get_script_name",
+    "is_bundled_script",
+    "make_script_command",
     "normalize_returncode",
     "require_script_path",
     "resolve_script_path",
+    "run_stagerunner",
 ]
@@ -19,13 +19,8 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
-import lib_log_rich.runtime
-import rich_click as click
-
-from ..constants import CLICK_CONTEXT_SETTINGS
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, make_script_command, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
@@ -37,55 +32,36 @@ def _run_build() -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Build")
-
-    command_prefix = "bld"
-    logger.debug("Executing build script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, (), command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Build", "bld", execute=execute_script)
 
 
 # =============================================================================
-# Main command: build
+# Commands: build and its alias, generated from one spec table
 # =============================================================================
 
+_BUILD_HELP = """Build Python wheel and sdist artifacts.
 
-@click.command("build", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_build() -> None:
-    """Build Python wheel and sdist artifacts.
-
-    Builds distribution artifacts for PyPI using ``python -m build``.
-    The dist/ directory is cleaned before building to avoid stale artifacts.
+Builds distribution artifacts for PyPI using ``python -m build``.
+The dist/ directory is cleaned before building to avoid stale artifacts.
 
-    Example:
-        bmk build     # Build wheel and sdist
-        bmk bld       # Alias
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-build"):
-        logger.info("Building Python artifacts")
-        _run_build()
+Example:
+    bmk build     # Build wheel and sdist
+    bmk bld       # Alias"""
 
+_ALIAS_HELP = """Build Python artifacts (alias for 'build').
 
-# =============================================================================
-# Alias command: bld
-# =============================================================================
+See ``bmk build --help`` for full documentation."""
 
+#: ``(name, help, log message)`` for the build command and its alias.
+_COMMAND_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("build", _BUILD_HELP, "Building Python artifacts"),
+    ("bld", _ALIAS_HELP, "Building Python artifacts (via 'bld')"),
+)
 
-@click.command("bld", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_bld() -> None:
-    """Build Python artifacts (alias for 'build').
-
-    See ``bmk build --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-build"):
-        logger.info("Building Python artifacts (via 'bld')")
-        _run_build()
+cli_build, cli_bld = (
+    make_script_command(name, help_text, _run_build, job_id="cli-build", log_message=message, command_logger=logger)
+    for name, help_text, message in _COMMAND_SPECS
+)
 
 
 __all__ = ["cli_bld", "cli_build"]
@@ -0,0 +1,107 @@
+"""Implementation of the version bump subcommands.
+
+Holds the subcommand objects that :mod:`.bump_cmd` registers on each of the
+``bump``/``bmp``/``b`` groups.
+
+Contents:
+    * :data:`major_cmd`, :data:`ma_cmd` - Bump the major version.
+    * :data:`minor_cmd`, :data:`m_cmd` - Bump the minor version.
+    * :data:`patch_cmd`, :data:`p_cmd` - Bump the patch version.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from types import MappingProxyType
+from typing import Any
+
+import lib_log_rich.runtime
+import rich_click as click
+
+from ..constants import CLICK_CONTEXT_SETTINGS
+from ._shared import execute_script, run_stagerunner
+
+logger = logging.getLogger(__name__)
+
+
+def _run_bump(bump_type: str) -> None:
+    """Execute version bump via stagerunner.
+
+    Args:
+        bump_type: Type of version bump: "major", "minor", or "patch".
+
+    Raises:
+        SystemExit: With FILE_NOT_FOUND (2) if script not found,
+            or the script's exit code on failure.
+    """
+    run_stagerunner("Bump", f"bump_{bump_type}", execute=execute_script)
+
+
+# =============================================================================
+# Subcommand definitions (shared across all bump groups)
+# =============================================================================
+
+# Parallel columns, one entry per subcommand (index i describes one command).
+_NAMES: tuple[str, ...] = ("major", "ma", "minor", "m", "patch", "p")
+_BUMP_TYPES: tuple[str, ...] = ("major", "major", "minor", "minor", "patch", "patch")
+_HELPS: tuple[str, ...] = (
+    "Bump major version (X.0.0).",
+    "Bump major version (alias for 'major').",
+    "Bump minor version (X.Y.0).",
+    "Bump minor version (alias for 'minor').",
+    "Bump patch version (X.Y.Z).",
+    "Bump patch version (alias for 'patch').",
+)
+
+#: Subcommand name -> version part it bumps.
+_BUMP_TYPE_BY_NAME: dict[str, str] = dict(zip(_NAMES, _BUMP_TYPES, strict=True))
+
+#: Version part -> read-only ``extra`` bound into the logging context.
+_EXTRA_BY_TYPE: dict[str, Mapping[str, str]] = {
+    bump_type: MappingProxyType({"type": bump_type}) for bump_type in dict.fromkeys(_BUMP_TYPES)
+}
+
+
+def _bind_bump(bump_type: str) -> AbstractContextManager[Any]:
+    """Return the logging-context binding for a bump of *bump_type*.
+
+    Args:
+        bump_type: Version part being bumped ("major", "minor" or "patch").
+    """
+    return lib_log_rich.runtime.bind(job_id="cli-bump", extra=_EXTRA_BY_TYPE[bump_type])
+
+
+def _bump_callback() -> None:
+    """Run the bump selected by the invoked subcommand name.
+
+    One callback and one command object per name serve every bump group, so
+    the version part is read from the Click context rather than baked into
+    per-group closures. Alias subcommands (``ma``, ``m``, ``p``) are named in
+    the log message; the canonical names are not.
+    """
+    command_name = click.get_current_context().command.name or ""
+    bump_type = _BUMP_TYPE_BY_NAME[command_name]
+    alias_suffix = "" if command_name == bump_type else f" (via alias '{command_name}')"
+    with _bind_bump(bump_type):
+        logger.info("Bumping %s version%s", bump_type, alias_suffix)
+        _run_bump(bump_type)
+
+
+def _make_bump_subcommand(name: str, help_text: str) -> click.Command:
+    """Create the Click command for one subcommand spec.
+
+    Args:
+        name: CLI subcommand name (e.g. "major", "ma").
+        help_text: Help string displayed by ``--help``.
+    """
+    return click.RichCommand(name, callback=_bump_callback, help=help_text, context_settings=CLICK_CONTEXT_SETTINGS)
+
+
+major_cmd, ma_cmd, minor_cmd, m_cmd, patch_cmd, p_cmd = (
+    _make_bump_subcommand(_NAMES[i], _HELPS[i]) for i in range(len(_NAMES))
+)
+
+
+__all__ = ["m_cmd", "ma_cmd", "major_cmd", "minor_cmd", "p_cmd", "patch_cmd"]
@@ -20,13 +20,8 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
-import lib_log_rich.runtime
-import rich_click as click
-
-from ..constants import CLICK_CONTEXT_SETTINGS
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, make_script_command, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
@@ -38,73 +33,43 @@ def _run_clean() -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Clean")
-
-    command_prefix = "clean"
-    logger.debug("Executing clean script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, (), command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
-
-
-# =============================================================================
-# Main command: clean
-# =============================================================================
-
-
-@click.command("clean", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_clean() -> None:
-    """Clean build artifacts and cache directories.
-
-    Removes common build artifacts, cache directories, and temporary files
-    from the project. Reads patterns from pyproject.toml [tool.clean].patterns
-    or uses built-in defaults.
-
-    Example:
-        bmk clean     # Clean build artifacts
-        bmk cln       # Alias
-        bmk cl        # Short alias
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-clean"):
-        logger.info("Cleaning build artifacts")
-        _run_clean()
-
-
-# =============================================================================
-# Alias command: cln
-# =============================================================================
-
-
-@click.command("cln", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_cln() -> None:
-    """Clean build artifacts (alias for 'clean').
-
-    See ``bmk clean --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-clean"):
-        logger.info("Cleaning build artifacts (via 'cln')")
-        _run_clean()
+    run_stagerunner("Clean", "clean", execute=execute_script)
 
 
 # =============================================================================
-# Short alias command: cl
+# Commands: clean and its aliases, generated from one spec table
 # =============================================================================
 
-
-@click.command("cl", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_cl() -> None:
-    """Clean build artifacts (short alias for 'clean').
-
-    See ``bmk clean --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-clean"):
-        logger.info("Cleaning build artifacts (via 'cl')")
-        _run_clean()
+_CLEAN_HELP = """Clean build artifacts and cache directories.
+
+Removes common build artifacts, cache directories, and temporary files
+from the project. Reads patterns from pyproject.toml [tool.clean].patterns
+or uses built-in defaults.
+
+Example:
+    bmk clean     # Clean build artifacts
+    bmk cln       # Alias
+    bmk cl        # Short alias"""
+
+#: ``(name, help, log message)`` for the clean command and its aliases.
+_COMMAND_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("clean", _CLEAN_HELP, "Cleaning build artifacts"),
+    (
+        "cln",
+        "Clean build artifacts (alias for 'clean').\n\nSee ``bmk clean --help`` for full documentation.",
+        "Cleaning build artifacts (via 'cln')",
+    ),
+    (
+        "cl",
+        "Clean build artifacts (short alias for 'clean').\n\nSee ``bmk clean --help`` for full documentation.",
+        "Cleaning build artifacts (via 'cl')",
+    ),
+)
+
+cli_clean, cli_cln, cli_cl = (
+    make_script_command(name, help_text, _run_clean, job_id="cli-clean", log_message=message, command_logger=logger)
+    for name, help_text, message in _COMMAND_SPECS
+)
 
 
 __all__ = ["cli_cl", "cli_cln", "cli_clean"]
@@ -17,17 +17,21 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..typed_click import argument
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_COMMIT_EXTRA = MappingProxyType({"command": "commit"})
+_C_EXTRA = MappingProxyType({"command": "c"})
+
 
 def _run_commit(args: tuple[str, ...]) -> None:
     """Shared implementation for commit commands.
@@ -39,17 +43,7 @@ def _run_commit(args: tuple[str, ...]) -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Commit")
-
-    logger.debug("Executing commit script: %s", script_path)
-    exit_code = execute_script(script_path, cwd, args, command_prefix="commit")
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Commit", "commit", args, execute=execute_script)
 
 
 @click.command("commit", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
@@ -78,7 +72,7 @@ def cli_commit(message: tuple[str, ...]) -> None:
         >>> result.exit_code in (0, 1, 2, 128)  # 0 success, 1 nothing to commit, 2 not found, 128 not a repo
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-commit", extra={"command": "commit"}):
+    with lib_log_rich.runtime.bind(job_id="cli-commit", extra=_COMMIT_EXTRA):
         logger.info("Executing commit command")
         _run_commit(message)
 
@@ -97,7 +91,7 @@ def cli_c(message: tuple[str, ...]) -> None:
         >>> result.exit_code in (0, 1, 2, 128)  # 0 success, 1 nothing to commit, 2 not found, 128 not a repo
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-commit", extra={"command": "c"}):
+    with lib_log_rich.runtime.bind(job_id="cli-commit", extra=_C_EXTRA):
         logger.info("Executing commit command (via alias 'c')")
         _run_commit(message)
 
@@ -12,14 +12,15 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import lib_log_rich.runtime
 import rich_click as click
-from lib_layered_config import Config, generate_examples
+from lib_layered_config import generate_examples
 
 from bmk import __init__conf__
 from bmk.adapters.config.overrides import apply_overrides
-from bmk.adapters.config.permissions import get_permission_defaults
 from bmk.domain.enums import DeployTarget, OutputFormat
 
 from ..constants import CLICK_CONTEXT_SETTINGS
@@ -27,14 +28,22 @@ from ..context import CLIContext, get_cli_context
 from ..exit_codes import ExitCode
 from ..typed_click import option
 
+if TYPE_CHECKING:
+    from lib_layered_config import Config
+
 logger = logging.getLogger(__name__)
 
+_OUTPUT_FORMAT_VALUES: tuple[str, ...] = tuple(f.value for f in OutputFormat)
+_OUTPUT_FORMAT_BY_LOWER: dict[str, OutputFormat] = {f.value.lower(): f for f in OutputFormat}
+_DEPLOY_TARGET_VALUES: tuple[str, ...] = tuple(t.value for t in DeployTarget)
+_DEPLOY_TARGET_BY_LOWER: dict[str, DeployTarget] = {t.value.lower(): t for t in DeployTarget}
+
 
 @click.command("config", context_settings=CLICK_CONTEXT_SETTINGS)
 @option(
     "--format",
     "output_format",
-    type=click.Choice([f.value for f in OutputFormat], case_sensitive=False),
+    type=click.Choice(_OUTPUT_FORMAT_VALUES, case_sensitive=False),
     default=OutputFormat.HUMAN.value,
     help="Output format (human-readable or JSON)",
 )
@@ -67,14 +76,13 @@ def cli_config(ctx: click.Context, output_format: str, section: str | None, prof
     """
     cli_ctx = get_cli_context(ctx)
     effective_config, effective_profile = _resolve_config(cli_ctx, profile)
-    fmt = OutputFormat(output_format.lower())
+    fmt = _OUTPUT_FORMAT_BY_LOWER[output_format.lower()]
 
-    extra = {"command": "config", "format": fmt.value, "profile": effective_profile}
+    extra = MappingProxyType(
+        {"command": "config", "format": fmt.value, "section": section, "profile": effective_profile}
+    )
     with lib_log_rich.runtime.bind(job_id="cli-config", extra=extra):
-        logger.info(
-            "Displaying configuration",
-            extra={"format": fmt.value, "section": section, "profile": effective_profile},
-        )
+        logger.info("Displaying configuration", extra=extra)
         click.echo()
         try:
             cli_ctx.services.display_config(
@@ -105,10 +113,16 @@ def _resolve_config(cli_ctx: CLIContext, profile: str | None) -> tuple[Config, s
         Tuple of (config, effective_profile).
     """
     effective_profile = _get_effective_profile(cli_ctx, profile)
-    if profile:
-        config = cli_ctx.services.get_config(profile=profile)
-        return apply_overrides(config, cli_ctx.set_overrides), effective_profile
-    return cli_ctx.config, effective_profile
+    if not profile:
+        return cli_ctx.config, effective_profile
+    config = cli_ctx.services.get_config(profile=profile)
+    if cli_ctx.set_overrides:
+        config = apply_overrides(config, cli_ctx.set_overrides)
+    return config, effective_profile
+
+
+#: Characters accepted in an octal mode once the ``0o`` prefix and digit-group underscores are removed.
+_OCTAL_DIGITS: frozenset[str] = frozenset("01234567")
 
 
 def _parse_octal_mode(ctx: click.Context, param: click.Parameter, value: str | None) -> int | None:
@@ -127,10 +141,14 @@ def _parse_octal_mode(ctx: click.Context, param: click.Parameter, value: str | N
     """
     if value is None:
         return None
+    text = value.strip()
+    digits = text[2:] if text[:2] in ("0o", "0O") else text
+    # Validate up front so signs and other int() leniencies are rejected.
+    if not digits or not _OCTAL_DIGITS.issuperset(digits.replace("_", "")):
+        raise click.BadParameter(f"Invalid octal mode: {value}")
     try:
-        # Handle both '750' and '0o750' formats
-        return int(value, 8) if not value.startswith("0o") else int(value, 0)
-    except ValueError as exc:
+        return int(digits, 8)
+    except ValueError as exc:  # misplaced underscores, e.g. "7__50"
         raise click.BadParameter(f"Invalid octal mode: {value}") from exc
 
 
@@ -138,7 +156,7 @@ def _parse_octal_mode(ctx: click.Context, param: click.Parameter, value: str | N
 @option(
     "--target",
     "targets",
-    type=click.Choice([t.value for t in DeployTarget], case_sensitive=False),
+    type=click.Choice(_DEPLOY_TARGET_VALUES, case_sensitive=False),
     multiple=True,
     required=True,
     help="Target configuration layer(s) to deploy to (can specify multiple)",
@@ -209,15 +227,14 @@ def cli_config_deploy(
     """
     cli_ctx = get_cli_context(ctx)
     effective_profile = _get_effective_profile(cli_ctx, profile)
-    deploy_targets = tuple(DeployTarget(t.lower()) for t in targets)
+    deploy_targets = tuple(_DEPLOY_TARGET_BY_LOWER[t.lower()] for t in targets)
     target_values = tuple(t.value for t in deploy_targets)
 
-    extra = {"command": "config-deploy", "targets": target_values, "force": force, "profile": effective_profile}
+    extra = MappingProxyType(
+        {"command": "config-deploy", "targets": target_values, "force": force, "profile": effective_profile}
+    )
     with lib_log_rich.runtime.bind(job_id="cli-config-deploy", extra=extra):
-        logger.info(
-            "Deploying configuration",
-            extra={"targets": target_values, "force": force, "profile": effective_profile},
-        )
+        logger.info("Deploying configuration", extra=extra)
         _execute_deploy(cli_ctx, deploy_targets, force, effective_profile, set_permissions, dir_mode, file_mode)
 
 
@@ -244,6 +261,8 @@ def _execute_deploy(
     Raises:
         SystemExit: On permission or other errors.
     """
+    from bmk.adapters.config.permissions import get_permission_defaults
+
     # Get permission defaults from config
     perm_defaults = get_permission_defaults(cli_ctx.config)
 
@@ -282,12 +301,14 @@ def _report_deployment_result(deployed_paths: list[Path], profile: str | None, s
     if deployed_paths:
         profile_msg = f" (profile: {profile})" if profile else ""
         perm_msg = "" if set_permissions else " (permissions not set)"
-        click.echo(f"\nConfiguration deployed successfully{profile_msg}{perm_msg}:")
-        for path in deployed_paths:
-            click.echo(f"  ✓ {path}")
+        lines = [f"\nConfiguration deployed successfully{profile_msg}{perm_msg}:"]
+        lines.extend(f"  ✓ {path}" for path in deployed_paths)
+        click.echo("\n".join(lines))
     else:
-        click.echo("\nNo files were created (all target files already exist).")
-        click.echo("Use --force to overwrite existing configuration files.")
+        click.echo(
+            "\nNo files were created (all target files already exist).\n"
+            "Use --force to overwrite existing configuration files."
+        )
 
 
 @click.command("config-generate-examples", context_settings=CLICK_CONTEXT_SETTINGS)
@@ -309,9 +330,9 @@ def cli_config_generate_examples(ctx: click.Context, destination: str, force: bo
         >>> runner = CliRunner()
         >>> # Real invocation tested in test_cli_config.py
     """
-    extra = {"command": "config-generate-examples", "destination": destination, "force": force}
+    extra = MappingProxyType({"command": "config-generate-examples", "destination": destination, "force": force})
     with lib_log_rich.runtime.bind(job_id="cli-config-generate-examples", extra=extra):
-        logger.info("Generating example configuration files", extra={"destination": destination, "force": force})
+        logger.info("Generating example configuration files", extra=extra)
         try:
             paths = generate_examples(
                 destination=destination,
@@ -20,13 +20,8 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
-import lib_log_rich.runtime
-import rich_click as click
-
-from ..constants import CLICK_CONTEXT_SETTINGS
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, make_script_command, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
@@ -38,72 +33,41 @@ def _run_cov() -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Coverage")
-
-    command_prefix = "cov"
-    logger.debug("Executing coverage script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, (), command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
-
-
-# =============================================================================
-# Main command: codecov
-# =============================================================================
-
-
-@click.command("codecov", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_codecov() -> None:
-    """Upload coverage report to Codecov.
-
-    Uploads the coverage.xml report to Codecov using the official Codecov CLI.
-    Requires CODECOV_TOKEN to be set in environment or .env file.
-
-    Example:
-        bmk codecov     # Upload coverage
-        bmk coverage    # Alias
-        bmk cov         # Short alias
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-codecov"):
-        logger.info("Uploading coverage to Codecov")
-        _run_cov()
+    run_stagerunner("Coverage", "cov", execute=execute_script)
 
 
 # =============================================================================
-# Alias command: coverage
+# Commands: codecov and its aliases, generated from one spec table
 # =============================================================================
 
-
-@click.command("coverage", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_coverage() -> None:
-    """Upload coverage report (alias for 'codecov').
-
-    See ``bmk codecov --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-codecov"):
-        logger.info("Uploading coverage to Codecov (via 'coverage')")
-        _run_cov()
-
-
-# =============================================================================
-# Short alias command: cov
-# =============================================================================
-
-
-@click.command("cov", context_settings=CLICK_CONTEXT_SETTINGS)
-def cli_cov() -> None:
-    """Upload coverage report (short alias for 'codecov').
-
-    See ``bmk codecov --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-codecov"):
-        logger.info("Uploading coverage to Codecov (via 'cov')")
-        _run_cov()
-
+_CODECOV_HELP = """Upload coverage report to Codecov.
+
+Uploads the coverage.xml report to Codecov using the official Codecov CLI.
+Requires CODECOV_TOKEN to be set in environment or .env file.
+
+Example:
+    bmk codecov     # Upload coverage
+    bmk coverage    # Alias
+    bmk cov         # Short alias"""
+
+#: ``(name, help, log message)`` for the codecov command and its aliases.
+_COMMAND_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("codecov", _CODECOV_HELP, "Uploading coverage to Codecov"),
+    (
+        "coverage",
+        "Upload coverage report (alias for 'codecov').\n\nSee ``bmk codecov --help`` for full documentation.",
+        "Uploading coverage to Codecov (via 'coverage')",
+    ),
+    (
+        "cov",
+        "Upload coverage report (short alias for 'codecov').\n\nSee ``bmk codecov --help`` for full documentation.",
+        "Uploading coverage to Codecov (via 'cov')",
+    ),
+)
+
+cli_codecov, cli_coverage, cli_cov = (
+    make_script_command(name, help_text, _run_cov, job_id="cli-codecov", log_message=message, command_logger=logger)
+    for name, help_text, message in _COMMAND_SPECS
+)
 
 __all__ = ["cli_codecov", "cli_cov", "cli_coverage"]
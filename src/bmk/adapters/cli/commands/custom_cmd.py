@@ -19,8 +19,10 @@ Contents:
 
 from __future__ import annotations
 
+import functools
 import logging
-import re
+import os
+import string
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -31,12 +33,15 @@ from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..context import get_cli_context
 from ..exit_codes import ExitCode
 from ..typed_click import argument
-from ._shared import execute_script, get_script_name
+from ._shared import BUNDLED_DIR, execute_script, get_script_name, is_bundled_script
 
 if TYPE_CHECKING:
     from lib_layered_config import Config
 
-_RE_COMMAND_NAME = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$")
+#: Characters allowed first in a command name, and anywhere in it.
+_FIRST_ALLOWED: frozenset[str] = frozenset(string.ascii_letters + string.digits)
+_ALLOWED: frozenset[str] = _FIRST_ALLOWED | frozenset("_-")
+_DIGITS: frozenset[str] = frozenset(string.digits)
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +59,27 @@ def resolve_override_dir(cwd: Path, bmk_config: dict[str, str]) -> Path:
     override_dir = bmk_config.get("override_dir", "")
     if override_dir:
         resolved = Path(override_dir)
-        try:
-            resolved.resolve().relative_to(cwd.resolve())
-        except ValueError:
+        if not _is_within(override_dir, os.fspath(cwd)):
             logger.warning("Override directory '%s' is outside project tree '%s'", resolved, cwd)
         return resolved
     return cwd / "makescripts"
 
 
+@functools.lru_cache(maxsize=64)
+def _is_within(path: str, root: str) -> bool:
+    """Return whether *path* resolves to a location inside *root*.
+
+    Memoized on the raw strings: both sides go through ``realpath``, and the
+    result only decides whether :func:`resolve_override_dir` logs a warning.
+    Containment is a normcased prefix test, so no exception is raised for
+    paths outside *root* (``commonpath`` would raise across Windows drives).
+    """
+    real_path = os.path.normcase(os.path.realpath(path))
+    real_root = os.path.normcase(os.path.realpath(root))
+    root_prefix = real_root if real_root.endswith(os.sep) else real_root + os.sep
+    return real_path == real_root or real_path.startswith(root_prefix)
+
+
 def validate_command_name(name: str) -> None:
     """Reject command names containing glob metacharacters or path separators.
 
@@ -74,7 +92,7 @@ def validate_command_name(name: str) -> None:
     Raises:
         click.BadParameter: If the name contains unsafe characters.
     """
-    if not _RE_COMMAND_NAME.match(name):
+    if not (name and name[0] in _FIRST_ALLOWED and _ALLOWED.issuperset(name)):
         msg = (
             f"Invalid command name '{name}'. "
             "Only letters, digits, hyphens, and underscores are allowed "
@@ -86,6 +104,10 @@ def validate_command_name(name: str) -> None:
 def find_custom_scripts(override_dir: Path, command_name: str) -> list[Path]:
     """Glob for ``{name}_[0-9]*_*.sh`` in the override directory.
 
+    Reads the directory with one :func:`os.scandir` pass and plain string
+    checks, creating a :class:`~pathlib.Path` only for matches. A missing
+    or unreadable directory yields an empty list.
+
     Args:
         override_dir: Directory to search for scripts.
         command_name: Command prefix to match against script filenames.
@@ -93,10 +115,20 @@ def find_custom_scripts(override_dir: Path, command_name: str) -> list[Path]:
     Returns:
         Sorted list of matching script paths.
     """
-    if not override_dir.is_dir():
+    prefix = os.path.normcase(f"{command_name}_")
+    matches: list[Path] = []
+    try:
+        with os.scandir(override_dir) as entries:
+            for entry in entries:
+                name = os.path.normcase(entry.name)
+                if not (name.startswith(prefix) and name.endswith(".sh")):
+                    continue
+                rest = name[len(prefix) : -len(".sh")]
+                if rest[:1] in _DIGITS and "_" in rest[1:]:
+                    matches.append(Path(entry.path))
+    except OSError:
         return []
-    pattern = f"{command_name}_[0-9]*_*.sh"
-    return sorted(override_dir.glob(pattern))
+    return sorted(matches)
 
 
 def _run_custom(command_name: str, args: tuple[str, ...], config: Config) -> None:
@@ -113,7 +145,7 @@ def _run_custom(command_name: str, args: tuple[str, ...], config: Config) -> Non
     """
     validate_command_name(command_name)
     cwd = Path.cwd()
-    bmk_config = config.as_dict().get("bmk", {})
+    bmk_config = config.get("bmk", {})
     override_dir = resolve_override_dir(cwd, bmk_config)
 
     if not override_dir.is_dir():
@@ -133,8 +165,8 @@ def _run_custom(command_name: str, args: tuple[str, ...], config: Config) -> Non
 
     script_name = get_script_name()
     # Resolve stagerunner from bundled location
-    bundled_script = Path(__file__).parent.parent.parent.parent / "makescripts" / script_name
-    if not bundled_script.is_file():
+    bundled_script = BUNDLED_DIR / script_name
+    if not is_bundled_script(script_name):
         click.echo(f"Error: Stagerunner '{script_name}' not found", err=True)
         raise SystemExit(ExitCode.FILE_NOT_FOUND)
 
@@ -21,17 +21,21 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import CLICK_CONTEXT_SETTINGS
 from ..typed_click import option
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_UPDATE_EXTRA = MappingProxyType({"action": "update"})
+_CHECK_EXTRA = MappingProxyType({"action": "check"})
+
 
 def _run_dependencies(action: str) -> None:
     """Execute dependency check/update via stagerunner.
@@ -43,161 +47,118 @@ def _run_dependencies(action: str) -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Dependencies")
-
-    command_prefix = f"deps_{action}" if action else "deps"
-    logger.debug("Executing dependencies script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, (), command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Dependencies", f"deps_{action}" if action else "deps", execute=execute_script)
 
 
 # =============================================================================
-# Main command group: dependencies
+# Update subcommands (shared across all dependency groups)
 # =============================================================================
 
 
-@click.group("dependencies", invoke_without_command=True, context_settings=CLICK_CONTEXT_SETTINGS)
-@option("-u", "--update", is_flag=True, help="Update outdated dependencies")
-@click.pass_context
-def cli_dependencies(ctx: click.Context, update: bool) -> None:
-    """Check and manage project dependencies.
+def _via(path: str | None, canonical: str) -> str:
+    """Return the ``" (via '...')"`` log suffix for a group invocation.
 
-    Compares dependencies in pyproject.toml against latest PyPI versions.
-
-    Example:
-        bmk dependencies           # Check for outdated dependencies
-        bmk dependencies update    # Update outdated dependencies
-        bmk deps -u                # Update using flag shorthand
-    """
-    if ctx.invoked_subcommand is None:
-        with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update" if update else "check"}):
-            if update:
-                logger.info("Updating dependencies")
-                _run_dependencies("update")
-            else:
-                logger.info("Checking dependencies")
-                _run_dependencies("")
-
-
-@cli_dependencies.command("update")
-def dependencies_cmd_update() -> None:
-    """Update outdated dependencies to latest versions.
-
-    Reads pyproject.toml, checks for newer versions on PyPI, and updates
-    dependency specifications in-place.
-
-    Example:
-        >>> from click.testing import CliRunner
-        >>> runner = CliRunner()
-        >>> result = runner.invoke(dependencies_cmd_update)
-        >>> result.exit_code in (0, 1, 2)
-        True
+    Args:
+        path: How the group was invoked (e.g. "deps").
+        canonical: Invocation that gets no suffix (e.g. "dependencies").
     """
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies")
+    return "" if path == canonical else f" (via '{path}')"
+
+
+#: Invocation path -> log suffix for the shared update subcommands (historical wording).
+_UPDATE_LOG_SUFFIX: dict[str, str] = {
+    "dependencies update": "",
+    "dependencies u": " (via alias 'u')",
+    "deps update": " (via 'deps')",
+    "deps u": " (via 'deps u')",
+    "d update": " (via 'd')",
+    "d u": " (via 'd u')",
+}
+
+
+def _update_callback() -> None:
+    """Update dependencies; one callback serves every group's update/u subcommand."""
+    ctx = click.get_current_context()
+    path = f"{ctx.parent.info_name} {ctx.info_name}" if ctx.parent is not None else ctx.info_name
+    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra=_UPDATE_EXTRA):
+        logger.info("Updating dependencies%s", _UPDATE_LOG_SUFFIX.get(path or "", ""))
         _run_dependencies("update")
 
 
-@cli_dependencies.command("u")
-def dependencies_cmd_u() -> None:
-    """Update outdated dependencies (alias for 'update').
+_UPDATE_HELP = """Update outdated dependencies to latest versions.
 
-    See ``bmk dependencies update --help`` for full documentation.
+Reads pyproject.toml, checks for newer versions on PyPI, and updates
+dependency specifications in-place."""
 
-    Example:
-        >>> from click.testing import CliRunner
-        >>> runner = CliRunner()
-        >>> result = runner.invoke(dependencies_cmd_u)
-        >>> result.exit_code in (0, 1, 2)
-        True
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies (via alias 'u')")
-        _run_dependencies("update")
-
-
-# =============================================================================
-# Alias command group: deps
-# =============================================================================
+#: ``(name, help)`` for the update subcommand and its alias.
+_UPDATE_SPECS: tuple[tuple[str, str], ...] = (
+    ("update", _UPDATE_HELP),
+    (
+        "u",
+        "Update outdated dependencies (alias for 'update').\n\n"
+        "See ``bmk dependencies update --help`` for full documentation.",
+    ),
+)
 
-
-@click.group("deps", invoke_without_command=True, context_settings=CLICK_CONTEXT_SETTINGS)
-@option("-u", "--update", is_flag=True, help="Update outdated dependencies")
-@click.pass_context
-def cli_deps(ctx: click.Context, update: bool) -> None:
-    """Check and manage project dependencies (alias for 'dependencies').
-
-    See ``bmk dependencies --help`` for full documentation.
-    """
-    if ctx.invoked_subcommand is None:
-        with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update" if update else "check"}):
-            if update:
-                logger.info("Updating dependencies (via 'deps')")
-                _run_dependencies("update")
-            else:
-                logger.info("Checking dependencies (via 'deps')")
-                _run_dependencies("")
-
-
-@cli_deps.command("update")
-def deps_cmd_update() -> None:
-    """Update outdated dependencies to latest versions."""
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies (via 'deps')")
-        _run_dependencies("update")
-
-
-@cli_deps.command("u")
-def deps_cmd_u() -> None:
-    """Update outdated dependencies (alias)."""
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies (via 'deps u')")
-        _run_dependencies("update")
+_UPDATE_COMMANDS: tuple[click.Command, ...] = tuple(
+    click.RichCommand(name, callback=_update_callback, help=help_text, context_settings=CLICK_CONTEXT_SETTINGS)
+    for name, help_text in _UPDATE_SPECS
+)
 
 
 # =============================================================================
-# Short alias command group: d
+# Command groups: dependencies and its aliases, generated from one spec table
 # =============================================================================
 
 
-@click.group("d", invoke_without_command=True, context_settings=CLICK_CONTEXT_SETTINGS)
-@option("-u", "--update", is_flag=True, help="Update outdated dependencies")
-@click.pass_context
-def cli_d(ctx: click.Context, update: bool) -> None:
-    """Check and manage project dependencies (short alias for 'dependencies').
+def _make_dependencies_group(name: str, help_text: str) -> click.Group:
+    """Create a dependency group that checks by default and updates with ``-u``.
 
-    See ``bmk dependencies --help`` for full documentation.
+    Args:
+        name: CLI group name (e.g. "dependencies", "deps", "d").
+        help_text: Help string displayed by ``--help``.
     """
-    if ctx.invoked_subcommand is None:
-        with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update" if update else "check"}):
-            if update:
-                logger.info("Updating dependencies (via 'd')")
-                _run_dependencies("update")
-            else:
-                logger.info("Checking dependencies (via 'd')")
-                _run_dependencies("")
-
-
-@cli_d.command("update")
-def d_cmd_update() -> None:
-    """Update outdated dependencies to latest versions."""
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies (via 'd')")
-        _run_dependencies("update")
-
-
-@cli_d.command("u")
-def d_cmd_u() -> None:
-    """Update outdated dependencies (alias)."""
-    with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra={"action": "update"}):
-        logger.info("Updating dependencies (via 'd u')")
-        _run_dependencies("update")
 
+    @click.group(name, invoke_without_command=True, context_settings=CLICK_CONTEXT_SETTINGS, help=help_text)
+    @option("-u", "--update", is_flag=True, help="Update outdated dependencies")
+    @click.pass_context
+    def _group(ctx: click.Context, update: bool) -> None:
+        if ctx.invoked_subcommand is not None:
+            return
+        with lib_log_rich.runtime.bind(job_id="cli-dependencies", extra=_UPDATE_EXTRA if update else _CHECK_EXTRA):
+            verb = "Updating" if update else "Checking"
+            logger.info("%s dependencies%s", verb, _via(ctx.info_name, "dependencies"))
+            _run_dependencies("update" if update else "")
+
+    for command in _UPDATE_COMMANDS:
+        _group.add_command(command)
+    return _group
+
+
+_DEPENDENCIES_HELP = """Check and manage project dependencies.
+
+Compares dependencies in pyproject.toml against latest PyPI versions.
+
+Example:
+    bmk dependencies           # Check for outdated dependencies
+    bmk dependencies update    # Update outdated dependencies
+    bmk deps -u                # Update using flag shorthand"""
+
+#: ``(name, help)`` for the dependencies group and its aliases.
+_GROUP_SPECS: tuple[tuple[str, str], ...] = (
+    ("dependencies", _DEPENDENCIES_HELP),
+    (
+        "deps",
+        "Check and manage project dependencies (alias for 'dependencies').\n\n"
+        "See ``bmk dependencies --help`` for full documentation.",
+    ),
+    (
+        "d",
+        "Check and manage project dependencies (short alias for 'dependencies').\n\n"
+        "See ``bmk dependencies --help`` for full documentation.",
+    ),
+)
+
+cli_dependencies, cli_deps, cli_d = (_make_dependencies_group(name, help_text) for name, help_text in _GROUP_SPECS)
 
 __all__ = ["cli_d", "cli_deps", "cli_dependencies"]
@@ -6,11 +6,10 @@ shared between send-email and send-notification commands.
 
 from __future__ import annotations
 
-import functools
 import logging
 import os
-from collections.abc import Callable
-from typing import Any, cast
+from collections.abc import Callable, Sequence
+from typing import Any
 
 import rich_click as click
 from lib_layered_config import Config
@@ -40,22 +39,18 @@ def filter_sentinels(**kwargs: Any) -> dict[str, Any]:
     Returns:
         Filtered dict with sentinel values removed and tuples converted to lists.
     """
-    result: dict[str, Any] = {}
-    for k, v in kwargs.items():
-        if v is None or v == ():
-            continue
-        if isinstance(v, tuple):
-            result[k] = list(cast(tuple[Any, ...], v))
-        else:
-            result[k] = v
-    return result
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in kwargs.items() if v is not None and v != ()}
 
 
 def apply_validated_overrides(base_config: EmailConfig, overrides: dict[str, Any]) -> EmailConfig:
     """Apply overrides with full Pydantic validation.
 
     Uses model_validate() with a merged dict instead of model_copy(update=...)
-    to ensure Pydantic validators run on all overridden values.
+    to ensure Pydantic validators run on all overridden values. The whole
+    model is revalidated because EmailConfig has a cross-field model
+    validator; the base values come from iterating the model (field name,
+    value pairs) rather than ``model_dump()`` since they are already
+    validated and need no serialization pass.
 
     Args:
         base_config: Base EmailConfig to merge overrides into.
@@ -69,41 +64,46 @@ def apply_validated_overrides(base_config: EmailConfig, overrides: dict[str, Any
     """
     if not overrides:
         return base_config
-    base_dict = base_config.model_dump()
-    merged = {**base_dict, **overrides}
+    merged = {**dict(base_config), **overrides}
     return EmailConfig.model_validate(merged)
 
 
+#: SMTP override option decorators, built once and shared by every email command.
+_SMTP_OPTIONS: tuple[Callable[[Callable[..., Any]], Callable[..., Any]], ...] = (
+    option(
+        "--smtp-host",
+        "smtp_hosts",
+        multiple=True,
+        default=(),
+        help="Override SMTP host (can specify multiple; format host:port)",
+    ),
+    option("--smtp-username", default=None, help="Override SMTP authentication username"),
+    option("--smtp-password", default=None, help="Override SMTP authentication password"),
+    option("--use-starttls/--no-use-starttls", default=None, help="Override STARTTLS setting"),
+    option("--timeout", "timeout", type=float, default=None, help="Override socket timeout in seconds"),
+    option(
+        "--raise-on-missing-attachments/--no-raise-on-missing-attachments",
+        default=None,
+        help="Override missing attachment handling",
+    ),
+    option(
+        "--raise-on-invalid-recipient/--no-raise-on-invalid-recipient",
+        default=None,
+        help="Override invalid recipient handling",
+    ),
+)
+
+
 def smtp_config_options(func: Callable[..., Any]) -> Callable[..., Any]:
     """Apply shared SMTP configuration override options to a Click command.
 
     Adds CLI flags for all EmailConfig fields so that any TOML setting
     can be overridden at invocation time.
     """
-    options = [
-        option(
-            "--smtp-host",
-            "smtp_hosts",
-            multiple=True,
-            default=(),
-            help="Override SMTP host (can specify multiple; format host:port)",
-        ),
-        option("--smtp-username", default=None, help="Override SMTP authentication username"),
-        option("--smtp-password", default=None, help="Override SMTP authentication password"),
-        option("--use-starttls/--no-use-starttls", default=None, help="Override STARTTLS setting"),
-        option("--timeout", "timeout", type=float, default=None, help="Override socket timeout in seconds"),
-        option(
-            "--raise-on-missing-attachments/--no-raise-on-missing-attachments",
-            default=None,
-            help="Override missing attachment handling",
-        ),
-        option(
-            "--raise-on-invalid-recipient/--no-raise-on-invalid-recipient",
-            default=None,
-            help="Override invalid recipient handling",
-        ),
-    ]
-    return functools.reduce(lambda f, opt: opt(f), reversed(options), func)
+    # Apply bottom-up, as stacked decorators would, so options keep their listed order in --help.
+    for opt in reversed(_SMTP_OPTIONS):
+        func = opt(func)
+    return func
 
 
 def load_and_validate_email_config(config: Config, loader: LoadEmailConfigFromDict) -> EmailConfig:
@@ -133,20 +133,24 @@ def load_and_validate_email_config(config: Config, loader: LoadEmailConfigFromDi
 
 
 def execute_with_email_error_handling(
+    operation: Callable[..., bool],
+    /,
     *,
-    operation: Callable[[], bool],
-    recipients: list[str] | None,
+    recipients: Sequence[str] | None,
     message_type: str,
     catches_file_not_found: bool = False,
+    **op_kwargs: Any,
 ) -> None:
     """Execute an email operation with unified error handling.
 
     Args:
-        operation: Zero-arg callable returning True on success.
-        recipients: Recipients for logging context.
+        operation: Callable returning True on success, invoked as
+            ``operation(recipients=recipients, **op_kwargs)``.
+        recipients: Recipients passed to the operation and used for logging context.
         message_type: "Email" or "Notification" for display messages.
         catches_file_not_found: When True, catches FileNotFoundError
             (needed for send-email with attachments).
+        **op_kwargs: Remaining keyword arguments for *operation*.
 
     Raises:
         SystemExit: On any error (unless DEVELOPMENT_MODE is set).
@@ -170,7 +174,7 @@ def execute_with_email_error_handling(
         bugs with full tracebacks during development.
     """
     try:
-        result = operation()
+        result = operation(recipients=recipients, **op_kwargs)
         _handle_send_result(result, recipients, message_type)
     except ConfigurationError as exc:
         _handle_send_error(
@@ -227,7 +231,7 @@ def handle_validation_error(exc: ValidationError) -> None:
     _handle_send_error(exc, "Invalid configuration", "Invalid option value", exit_code=ExitCode.INVALID_ARGUMENT)
 
 
-def _handle_send_result(result: bool, recipients: list[str] | None, message_type: str) -> None:
+def _handle_send_result(result: bool, recipients: Sequence[str] | None, message_type: str) -> None:
     """Handle the result of a send operation.
 
     Args:
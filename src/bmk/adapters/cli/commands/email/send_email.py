@@ -5,8 +5,8 @@ Provides the send-email command with HTML and attachment support.
 
 from __future__ import annotations
 
-import functools
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 
 import lib_log_rich.runtime
@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 
 def _log_send_email_start(
-    recipients: list[str] | None,
+    recipients: Sequence[str] | None,
     subject: str,
     body_html: str,
     attachments: tuple[str, ...],
@@ -42,6 +42,8 @@ def _log_send_email_start(
         body_html: HTML body content.
         attachments: Attachment file paths.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         "Sending email",
         extra={
@@ -98,7 +100,7 @@ def cli_send_email(
         >>> # Real invocation tested in test_cli_email.py
     """
     cli_ctx = get_cli_context(ctx)
-    resolved_recipients = list(recipients) if recipients else None
+    resolved_recipients = recipients or None
     extra = {"command": "send-email", "recipients": resolved_recipients, "subject": subject}
 
     with lib_log_rich.runtime.bind(job_id="cli-send-email", extra=extra):
@@ -116,20 +118,17 @@ def cli_send_email(
             email_config = apply_validated_overrides(email_config, overrides)
         except ValidationError as exc:
             handle_validation_error(exc)
-        attachment_paths = [Path(p) for p in attachments] if attachments else None
+        attachment_paths = tuple(map(Path, attachments)) or None
 
         _log_send_email_start(resolved_recipients, subject, body_html, attachments)
         execute_with_email_error_handling(
-            operation=functools.partial(
-                cli_ctx.services.send_email,
-                config=email_config,
-                recipients=resolved_recipients,
-                subject=subject,
-                body=body,
-                body_html=body_html,
-                from_address=from_address,
-                attachments=attachment_paths,
-            ),
+            cli_ctx.services.send_email,
+            config=email_config,
+            subject=subject,
+            body=body,
+            body_html=body_html,
+            from_address=from_address,
+            attachments=attachment_paths,
             recipients=resolved_recipients,
             message_type="Email",
             catches_file_not_found=True,
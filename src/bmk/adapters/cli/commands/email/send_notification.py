@@ -5,7 +5,6 @@ Provides the send-notification command for simple plain-text emails.
 
 from __future__ import annotations
 
-import functools
 import logging
 
 import lib_log_rich.runtime
@@ -62,7 +61,7 @@ def cli_send_notification(
         >>> # Real invocation tested in test_cli_email.py
     """
     cli_ctx = get_cli_context(ctx)
-    resolved_recipients = list(recipients) if recipients else None
+    resolved_recipients = recipients or None
     extra = {"command": "send-notification", "recipients": resolved_recipients, "subject": subject}
 
     with lib_log_rich.runtime.bind(job_id="cli-send-notification", extra=extra):
@@ -80,16 +79,14 @@ def cli_send_notification(
             email_config = apply_validated_overrides(email_config, overrides)
         except ValidationError as exc:
             handle_validation_error(exc)
-        logger.info("Sending notification", extra={"recipients": resolved_recipients, "subject": subject})
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sending notification", extra={"recipients": resolved_recipients, "subject": subject})
         execute_with_email_error_handling(
-            operation=functools.partial(
-                cli_ctx.services.send_notification,
-                config=email_config,
-                recipients=resolved_recipients,
-                subject=subject,
-                message=message,
-                from_address=from_address,
-            ),
+            cli_ctx.services.send_notification,
+            config=email_config,
+            subject=subject,
+            message=message,
+            from_address=from_address,
             recipients=resolved_recipients,
             message_type="Notification",
         )
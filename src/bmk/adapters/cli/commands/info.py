@@ -10,6 +10,7 @@ Contents:
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
@@ -20,6 +21,10 @@ from ..constants import CLICK_CONTEXT_SETTINGS
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_INFO_EXTRA = MappingProxyType({"command": "info"})
+_FAIL_EXTRA = MappingProxyType({"command": "fail"})
+
 
 @click.command("info", context_settings=CLICK_CONTEXT_SETTINGS)
 def cli_info() -> None:
@@ -32,7 +37,7 @@ def cli_info() -> None:
         >>> result.exit_code == 0
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-info", extra={"command": "info"}):
+    with lib_log_rich.runtime.bind(job_id="cli-info", extra=_INFO_EXTRA):
         logger.info("Displaying package information")
         __init__conf__.print_info()
 
@@ -48,7 +53,7 @@ def cli_fail() -> None:
         >>> result.exit_code != 0
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-fail", extra={"command": "fail"}):
+    with lib_log_rich.runtime.bind(job_id="cli-fail", extra=_FAIL_EXTRA):
         logger.warning("Executing intentional failure command")
         raise RuntimeError("I should fail")
 
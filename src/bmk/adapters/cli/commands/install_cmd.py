@@ -3,7 +3,8 @@
 Copies the bundled ``Makefile`` from the package into the current working
 directory. Uses a sentinel comment (``# BMK MAKEFILE``) on the first line
 to distinguish managed Makefiles (safe to overwrite) from custom ones
-(left untouched).
+(left untouched). Only the file content is copied; the bundled file's
+permissions, timestamps and extended attributes are deliberately not.
 
 Contents:
     * :func:`cli_install` - Install or update the bmk Makefile.
@@ -12,8 +13,12 @@ Contents:
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
@@ -23,19 +28,58 @@ from ..exit_codes import ExitCode
 
 logger = logging.getLogger(__name__)
 
-_BMK_MAKEFILE_SENTINEL = "# BMK MAKEFILE"
+#: Read-only ``extra`` mappings bound into the logging context.
+_INSTALL_EXTRA = MappingProxyType({"command": "install"})
 
-_BUNDLED_MAKEFILE = Path(__file__).resolve().parent.parent.parent.parent / "makefile" / "Makefile"
+#: Managed-file marker, compared against the raw first line before any decoding.
+_BMK_MAKEFILE_SENTINEL = b"# BMK MAKEFILE"
 
+#: Upper bound on bytes read when inspecting a Makefile's sentinel line.
+_FIRST_LINE_LIMIT = 256
 
-def _extract_version(first_line: str) -> str | None:
-    """Extract version from a sentinel line like '# BMK MAKEFILE 1.0.0'.
+#: Located through the package's import metadata rather than resolving ``__file__``
+#: component by component.
+_BUNDLED_MAKEFILE = Path(str(files("bmk") / "makefile" / "Makefile"))
+
+
+def _extract_version(first_line: bytes) -> str | None:
+    """Extract version from a sentinel line like ``b'# BMK MAKEFILE 1.0.0'``.
+
+    Only the version part of a managed Makefile's line is decoded.
 
     Returns the version string ('1.0.0') or None if not a managed Makefile.
     """
     if not first_line.startswith(_BMK_MAKEFILE_SENTINEL):
         return None
-    return first_line[len(_BMK_MAKEFILE_SENTINEL) :].strip() or None
+    return first_line[len(_BMK_MAKEFILE_SENTINEL) :].strip().decode("utf-8", errors="replace") or None
+
+
+def _read_first_line(path: Path) -> bytes | None:
+    """Return the raw first line of *path* without its line ending.
+
+    At most :data:`_FIRST_LINE_LIMIT` bytes are read, so a file with an
+    unusually long first line is never read in full. Opening directly
+    instead of checking existence first saves a ``stat`` per lookup.
+
+    Returns:
+        The first line, or None if *path* does not exist.
+    """
+    try:
+        with path.open("rb") as handle:
+            return handle.readline(_FIRST_LINE_LIMIT).rstrip(b"\r\n")
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _bundled_version(bundled: Path) -> str | None:
+    """Return the sentinel version of the bundled Makefile, read once per path.
+
+    The bundled Makefile ships with the package and does not change while the
+    process runs. Returns None when the file is missing or not managed.
+    """
+    first_line = _read_first_line(bundled)
+    return None if first_line is None else _extract_version(first_line)
 
 
 def check_makefile_update() -> bool:
@@ -50,21 +94,18 @@ def check_makefile_update() -> bool:
     Silently returns False on any I/O error or non-interactive Abort.
     """
     target = Path.cwd() / "Makefile"
-    if not target.is_file() or not _BUNDLED_MAKEFILE.is_file():
+    local_first = _read_first_line(target)
+    if local_first is None:
         return False
 
-    local_first = target.read_text(encoding="utf-8").split("\n", maxsplit=1)[0]
     local_ver = _extract_version(local_first)
     if local_ver is None:
         return False
 
-    bundled_first = _BUNDLED_MAKEFILE.read_text(encoding="utf-8").split("\n", maxsplit=1)[0]
-    bundled_ver = _extract_version(bundled_first)
+    bundled_ver = _bundled_version(_BUNDLED_MAKEFILE)
     if bundled_ver is None or local_ver == bundled_ver:
         return False
 
-    import os
-
     auto_accept = os.environ.get("BMK_OUTPUT_FORMAT", "json") != "text"
 
     if not auto_accept and not click.confirm(
@@ -73,7 +114,7 @@ def check_makefile_update() -> bool:
     ):
         return False
 
-    shutil.copy2(_BUNDLED_MAKEFILE, target)
+    shutil.copyfile(_BUNDLED_MAKEFILE, target)
     if not auto_accept:
         click.echo(f"Makefile updated to {bundled_ver}")
     return True
@@ -91,7 +132,7 @@ def cli_install() -> None:
     Example:
         bmk install          # fresh install or update
     """
-    with lib_log_rich.runtime.bind(job_id="cli-install", extra={"command": "install"}):
+    with lib_log_rich.runtime.bind(job_id="cli-install", extra=_INSTALL_EXTRA):
         makefile_error: SystemExit | None = None
 
         if not _BUNDLED_MAKEFILE.is_file():
@@ -99,20 +140,20 @@ def cli_install() -> None:
             makefile_error = SystemExit(ExitCode.FILE_NOT_FOUND)
         else:
             target = Path.cwd() / "Makefile"
+            first_line = _read_first_line(target)
 
-            if target.exists():
-                first_line = target.read_text(encoding="utf-8").split("\n", maxsplit=1)[0]
+            if first_line is not None:
                 if not first_line.startswith(_BMK_MAKEFILE_SENTINEL):
                     click.echo("Makefile exists but is not managed by bmk — skipping", err=True)
                     makefile_error = SystemExit(ExitCode.GENERAL_ERROR)
                 else:
                     logger.info("Updating existing bmk Makefile")
                     click.echo("Updating existing bmk Makefile")
-                    shutil.copy2(_BUNDLED_MAKEFILE, target)
+                    shutil.copyfile(_BUNDLED_MAKEFILE, target)
             else:
                 logger.info("Installing bmk Makefile")
                 click.echo("Installing bmk Makefile")
-                shutil.copy2(_BUNDLED_MAKEFILE, target)
+                shutil.copyfile(_BUNDLED_MAKEFILE, target)
 
         from ._prerequisites import check_prerequisites, format_prerequisites_report
 
@@ -23,14 +23,13 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import CLICK_CONTEXT_SETTINGS
 from ..typed_click import argument
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
@@ -45,82 +44,57 @@ def run_push(message: tuple[str, ...]) -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Push")
-
-    command_prefix = "push"
-    logger.debug("Executing push script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, message, command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Push", "push", message, execute=execute_script)
 
 
 # =============================================================================
-# Main command: push
+# Commands: push and its aliases, generated from one spec table
 # =============================================================================
 
+_PUSH_HELP = """Run tests, commit changes, and push to remote.
 
-@click.command("push", context_settings=CLICK_CONTEXT_SETTINGS)
-@argument("message", nargs=-1)
-def cli_push(message: tuple[str, ...]) -> None:
-    """Run tests, commit changes, and push to remote.
+Updates dependencies, runs the test suite, commits all changes with a
+timestamped message, and pushes to the remote repository.
 
-    Updates dependencies, runs the test suite, commits all changes with a
-    timestamped message, and pushes to the remote repository.
+MESSAGE is the commit message (default: "chores").
 
-    MESSAGE is the commit message (default: "chores").
+Environment variables:
+    BMK_GIT_REMOTE: Git remote (default: origin)
+    BMK_GIT_BRANCH: Git branch (default: current branch)
 
-    Environment variables:
-        BMK_GIT_REMOTE: Git remote (default: origin)
-        BMK_GIT_BRANCH: Git branch (default: current branch)
+Example:
+    bmk push                    # Commit with default message
+    bmk push "fix bug"          # Commit with custom message
+    bmk psh                     # Alias
+    bmk p                       # Short alias"""
 
-    Example:
-        bmk push                    # Commit with default message
-        bmk push "fix bug"          # Commit with custom message
-        bmk psh                     # Alias
-        bmk p                       # Short alias
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-push"):
-        logger.info("Running push pipeline - this will take some minutes")
-        run_push(message)
+#: ``(name, help)`` for the push command and its aliases.
+_COMMAND_SPECS: tuple[tuple[str, str], ...] = (
+    ("push", _PUSH_HELP),
+    ("psh", "Run tests and push (alias for 'push').\n\nSee ``bmk push --help`` for full documentation."),
+    ("p", "Run tests and push (short alias for 'push').\n\nSee ``bmk push --help`` for full documentation."),
+)
 
 
-# =============================================================================
-# Alias command: psh
-# =============================================================================
-
+def _make_push_command(name: str, help_text: str) -> click.Command:
+    """Create the Click command for one push spec.
 
-@click.command("psh", context_settings=CLICK_CONTEXT_SETTINGS)
-@argument("message", nargs=-1)
-def cli_psh(message: tuple[str, ...]) -> None:
-    """Run tests and push (alias for 'push').
-
-    See ``bmk push --help`` for full documentation.
+    Args:
+        name: CLI command name (e.g. "push", "psh").
+        help_text: Help string displayed by ``--help``.
     """
-    with lib_log_rich.runtime.bind(job_id="cli-push"):
-        logger.info("Running push pipeline - this will take some minutes")
-        run_push(message)
-
 
-# =============================================================================
-# Short alias command: p
-# =============================================================================
+    @click.command(name, context_settings=CLICK_CONTEXT_SETTINGS, help=help_text)
+    @argument("message", nargs=-1)
+    def _cmd(message: tuple[str, ...]) -> None:
+        with lib_log_rich.runtime.bind(job_id="cli-push"):
+            logger.info("Running push pipeline - this will take some minutes")
+            run_push(message)
 
+    return _cmd
 
-@click.command("p", context_settings=CLICK_CONTEXT_SETTINGS)
-@argument("message", nargs=-1)
-def cli_push_p(message: tuple[str, ...]) -> None:
-    """Run tests and push (short alias for 'push').
 
-    See ``bmk push --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-push"):
-        logger.info("Running push pipeline - this will take some minutes")
-        run_push(message)
+cli_push, cli_psh, cli_push_p = (_make_push_command(name, help_text) for name, help_text in _COMMAND_SPECS)
 
 
 __all__ = ["cli_psh", "cli_push", "cli_push_p"]
@@ -20,14 +20,13 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..typed_click import argument
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
@@ -42,75 +41,61 @@ def run_release(args: tuple[str, ...]) -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Release")
-
-    command_prefix = "rel"
-    logger.debug("Executing release script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, args, command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Release", "rel", args, execute=execute_script)
 
 
 # =============================================================================
-# Main command: release
+# Commands: release and its aliases, generated from one spec table
 # =============================================================================
 
+_RELEASE_HELP = """Create a versioned release with git tag and GitHub release.
 
-@click.command("release", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
-@argument("args", nargs=-1, type=click.UNPROCESSED)
-def cli_release(args: tuple[str, ...]) -> None:
-    """Create a versioned release with git tag and GitHub release.
+Reads the version from pyproject.toml, creates an annotated git tag,
+pushes to the remote, and optionally creates a GitHub release via gh CLI.
 
-    Reads the version from pyproject.toml, creates an annotated git tag,
-    pushes to the remote, and optionally creates a GitHub release via gh CLI.
+Example:
+    bmk release       # Create release from current version
+    bmk rel           # Alias
+    bmk r             # Short alias"""
 
-    Example:
-        bmk release       # Create release from current version
-        bmk rel           # Alias
-        bmk r             # Short alias
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-release"):
-        logger.info("Creating release")
-        run_release(args)
+#: ``(name, help, log message)`` for the release command and its aliases.
+_COMMAND_SPECS: tuple[tuple[str, str, str], ...] = (
+    ("release", _RELEASE_HELP, "Creating release"),
+    (
+        "rel",
+        "Create a release (alias for 'release').\n\nSee ``bmk release --help`` for full documentation.",
+        "Creating release (via 'rel')",
+    ),
+    (
+        "r",
+        "Create a release (short alias for 'release').\n\nSee ``bmk release --help`` for full documentation.",
+        "Creating release (via 'r')",
+    ),
+)
 
 
-# =============================================================================
-# Alias command: rel
-# =============================================================================
-
+def _make_release_command(name: str, help_text: str, log_message: str) -> click.Command:
+    """Create the Click command for one release spec.
 
-@click.command("rel", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
-@argument("args", nargs=-1, type=click.UNPROCESSED)
-def cli_rel(args: tuple[str, ...]) -> None:
-    """Create a release (alias for 'release').
-
-    See ``bmk release --help`` for full documentation.
+    Args:
+        name: CLI command name (e.g. "release", "rel").
+        help_text: Help string displayed by ``--help``.
+        log_message: Info message logged before the release runs.
     """
-    with lib_log_rich.runtime.bind(job_id="cli-release"):
-        logger.info("Creating release (via 'rel')")
-        run_release(args)
-
 
-# =============================================================================
-# Short alias command: r
-# =============================================================================
+    @click.command(name, context_settings=PASSTHROUGH_CONTEXT_SETTINGS, help=help_text)
+    @argument("args", nargs=-1, type=click.UNPROCESSED)
+    def _cmd(args: tuple[str, ...]) -> None:
+        with lib_log_rich.runtime.bind(job_id="cli-release"):
+            logger.info(log_message)
+            run_release(args)
 
+    return _cmd
 
-@click.command("r", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
-@argument("args", nargs=-1, type=click.UNPROCESSED)
-def cli_r(args: tuple[str, ...]) -> None:
-    """Create a release (short alias for 'release').
 
-    See ``bmk release --help`` for full documentation.
-    """
-    with lib_log_rich.runtime.bind(job_id="cli-release"):
-        logger.info("Creating release (via 'r')")
-        run_release(args)
+cli_release, cli_rel, cli_r = (
+    _make_release_command(name, help_text, message) for name, help_text, message in _COMMAND_SPECS
+)
 
 
 __all__ = ["cli_r", "cli_rel", "cli_release"]
@@ -19,17 +19,20 @@ Contents:
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..typed_click import argument
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_RUN_EXTRA = MappingProxyType({"command": "run"})
+
 
 def _run_run(args: tuple[str, ...]) -> None:
     """Execute run via stagerunner.
@@ -41,18 +44,7 @@ def _run_run(args: tuple[str, ...]) -> None:
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Run")
-
-    command_prefix = "run"
-    logger.debug("Executing run script: %s with prefix %s", script_path, command_prefix)
-    exit_code = execute_script(script_path, cwd, args, command_prefix=command_prefix)
-
-    if exit_code != 0:
-        raise SystemExit(exit_code)
+    run_stagerunner("Run", "run", args, execute=execute_script)
 
 
 @click.command("run", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
@@ -69,7 +61,7 @@ def cli_run(args: tuple[str, ...]) -> None:
         bmk run info          # Run the project's info command
         bmk run --version     # Show project version
     """
-    with lib_log_rich.runtime.bind(job_id="cli-run", extra={"command": "run"}):
+    with lib_log_rich.runtime.bind(job_id="cli-run", extra=_RUN_EXTRA):
         logger.info("Executing run command")
         _run_run(args)
 
@@ -23,17 +23,22 @@ from __future__ import annotations
 
 import logging
 import os
-from pathlib import Path
+from types import MappingProxyType
 
 import lib_log_rich.runtime
 import rich_click as click
 
 from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..typed_click import argument, option
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_TESTINTEGRATION_EXTRA = MappingProxyType({"command": "testintegration"})
+_TESTI_EXTRA = MappingProxyType({"command": "testi"})
+_TI_EXTRA = MappingProxyType({"command": "ti"})
+
 
 def _run_test_integration(args: tuple[str, ...], *, human: bool = False) -> None:
     """Shared implementation for integration test commands.
@@ -46,24 +51,14 @@ def _run_test_integration(args: tuple[str, ...], *, human: bool = False) -> None
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Test runner")
-
-    logger.debug("Executing integration test script: %s", script_path)
-    exit_code = execute_script(
-        script_path,
-        cwd,
+    run_stagerunner(
+        "Test runner",
+        "test_integration",
         args,
-        command_prefix="test_integration",
+        execute=execute_script,
         output_format="text" if human else os.environ.get("BMK_OUTPUT_FORMAT", "json"),
     )
 
-    if exit_code != 0:
-        raise SystemExit(exit_code)
-
 
 @click.command("testintegration", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
 @option("--human", is_flag=True, default=False, help="Use human-readable text output instead of JSON.")
@@ -89,7 +84,7 @@ def cli_testintegration(human: bool, args: tuple[str, ...]) -> None:
         >>> result.exit_code in (0, 2)  # 0 if script exists, 2 if not found
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra={"command": "testintegration"}):
+    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra=_TESTINTEGRATION_EXTRA):
         logger.info("Executing integration test command - this will take some minutes")
         _run_test_integration(args, human=human)
 
@@ -109,7 +104,7 @@ def cli_testi(human: bool, args: tuple[str, ...]) -> None:
         >>> result.exit_code in (0, 2)  # 0 if script exists, 2 if not found
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra={"command": "testi"}):
+    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra=_TESTI_EXTRA):
         logger.info("Executing integration test command - this will take some minutes")
         _run_test_integration(args, human=human)
 
@@ -129,7 +124,7 @@ def cli_ti(human: bool, args: tuple[str, ...]) -> None:
         >>> result.exit_code in (0, 2)  # 0 if script exists, 2 if not found
         True
     """
-    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra={"command": "ti"}):
+    with lib_log_rich.runtime.bind(job_id="cli-test-integration", extra=_TI_EXTRA):
         logger.info("Executing integration test command - this will take some minutes")
         _run_test_integration(args, human=human)
 
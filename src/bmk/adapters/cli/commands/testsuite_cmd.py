@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 import os
-from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import lib_log_rich.runtime
@@ -30,13 +30,17 @@ import rich_click as click
 from ..constants import PASSTHROUGH_CONTEXT_SETTINGS
 from ..context import get_cli_context
 from ..typed_click import argument, option
-from ._shared import execute_script, get_script_name
+from ._shared import execute_script, run_stagerunner
 
 if TYPE_CHECKING:
     from lib_layered_config import Config
 
 logger = logging.getLogger(__name__)
 
+#: Read-only ``extra`` mappings bound into the logging context.
+_TEST_EXTRA = MappingProxyType({"command": "test"})
+_T_EXTRA = MappingProxyType({"command": "t"})
+
 
 def _run_test(args: tuple[str, ...], config: Config, *, human: bool = False) -> None:
     """Shared implementation for test commands.
@@ -50,28 +54,18 @@ def _run_test(args: tuple[str, ...], config: Config, *, human: bool = False) ->
         SystemExit: With FILE_NOT_FOUND (2) if script not found,
             or the script's exit code on failure.
     """
-    from ._shared import require_script_path
-
-    cwd = Path.cwd()
-    script_name = get_script_name()
-    script_path = require_script_path(script_name, cwd, "Test")
-
-    bmk_config = config.as_dict().get("bmk", {})
-
-    logger.debug("Executing test script: %s", script_path)
-    exit_code = execute_script(
-        script_path,
-        cwd,
+    bmk_config = config.get("bmk", {})
+    run_stagerunner(
+        "Test",
+        "test",
         args,
+        execute=execute_script,
         override_dir=bmk_config.get("override_dir", ""),
         package_name=bmk_config.get("package_name", ""),
         show_warnings=bmk_config.get("show_warnings", True),
         output_format="text" if human else os.environ.get("BMK_OUTPUT_FORMAT", "json"),
     )
 
-    if exit_code != 0:
-        raise SystemExit(exit_code)
-
 
 @click.command("test", context_settings=PASSTHROUGH_CONTEXT_SETTINGS)
 @option("--human", is_flag=True, default=False, help="Use human-readable text output instead of JSON.")
@@ -99,7 +93,7 @@ def cli_test(ctx: click.Context, human: bool, args: tuple[str, ...]) -> None:
         True
     """
     cli_ctx = get_cli_context(ctx)
-    with lib_log_rich.runtime.bind(job_id="cli-test", extra={"command": "test"}):
+    with lib_log_rich.runtime.bind(job_id="cli-test", extra=_TEST_EXTRA):
         logger.info("Executing test command - this will take some minutes")
         _run_test(args, cli_ctx.config, human=human)
 
@@ -121,7 +115,7 @@ def cli_t(ctx: click.Context, human: bool, args: tuple[str, ...]) -> None:
         True
     """
     cli_ctx = get_cli_context(ctx)
-    with lib_log_rich.runtime.bind(job_id="cli-test", extra={"command": "t"}):
+    with lib_log_rich.runtime.bind(job_id="cli-test", extra=_T_EXTRA):
         logger.info("Executing test command - this will take some minutes")
         _run_test(args, cli_ctx.config, human=human)
 
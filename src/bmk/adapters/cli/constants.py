@@ -1,6 +1,8 @@
 """Shared CLI constants.
 
 Centralizes configuration values used across CLI modules to ensure consistency.
+Holds plain data only and must not import Click/Rich, so the traceback limits
+and context-settings dicts can be read without loading the CLI framework.
 
 Contents:
     * :data:`CLICK_CONTEXT_SETTINGS` - Shared Click settings for help display.
@@ -20,7 +22,9 @@ CLICK_CONTEXT_SETTINGS: Final[dict[str, list[str]]] = {"help_option_names": ["-h
 #: ignore_unknown_options: Allows --flags to be passed through to the script
 #: allow_extra_args: Allows extra positional arguments
 #: allow_interspersed_args: Prevents Click from consuming args meant for the script
-PASSTHROUGH_CONTEXT_SETTINGS: dict[str, Any] = {
+#: Like CLICK_CONTEXT_SETTINGS, one dict is shared by reference across every command
+#: using it; a command needing different settings must pass its own copy.
+PASSTHROUGH_CONTEXT_SETTINGS: Final[dict[str, Any]] = {
     **CLICK_CONTEXT_SETTINGS,
     "ignore_unknown_options": True,
     "allow_extra_args": True,
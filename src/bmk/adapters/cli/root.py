@@ -124,92 +124,15 @@ def cli(ctx: click.Context, traceback: bool, profile: str | None, set_overrides:
 # the ``cli`` group, commands register themselves onto it, and those command
 # modules import from package ancestors. This is the standard Click pattern.
 def _register_commands() -> None:
-    from .commands import (
-        cli_b,
-        cli_bld,
-        cli_bmp,
-        cli_build,
-        cli_bump,
-        cli_c,
-        cli_cl,
-        cli_clean,
-        cli_cln,
-        cli_codecov,
-        cli_commit,
-        cli_config,
-        cli_config_deploy,
-        cli_config_generate_examples,
-        cli_cov,
-        cli_coverage,
-        cli_custom,
-        cli_d,
-        cli_dependencies,
-        cli_deps,
-        cli_fail,
-        cli_info,
-        cli_install,
-        cli_logdemo,
-        cli_psh,
-        cli_push,
-        cli_push_p,
-        cli_r,
-        cli_rel,
-        cli_release,
-        cli_run,
-        cli_send_email,
-        cli_send_notification,
-        cli_sh,
-        cli_ship,
-        cli_t,
-        cli_test,
-        cli_testi,
-        cli_testintegration,
-        cli_ti,
-    )
+    """Register every command exported by :mod:`.commands` on the root group.
+
+    The package's ``__all__`` is the single registry of top-level commands, so
+    adding a command there is enough to expose it on the root group.
+    """
+    from . import commands
 
-    for cmd in (
-        cli_b,
-        cli_bld,
-        cli_bmp,
-        cli_build,
-        cli_bump,
-        cli_c,
-        cli_cl,
-        cli_clean,
-        cli_cln,
-        cli_codecov,
-        cli_commit,
-        cli_cov,
-        cli_coverage,
-        cli_custom,
-        cli_d,
-        cli_dependencies,
-        cli_deps,
-        cli_info,
-        cli_install,
-        cli_fail,
-        cli_config,
-        cli_config_deploy,
-        cli_config_generate_examples,
-        cli_logdemo,
-        cli_psh,
-        cli_push,
-        cli_push_p,
-        cli_r,
-        cli_rel,
-        cli_release,
-        cli_run,
-        cli_send_email,
-        cli_send_notification,
-        cli_sh,
-        cli_ship,
-        cli_t,
-        cli_test,
-        cli_testintegration,
-        cli_testi,
-        cli_ti,
-    ):
-        cli.add_command(cmd)
+    for export in commands.__all__:
+        cli.add_command(getattr(commands, export))
 
 
 _register_commands()
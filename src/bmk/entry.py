@@ -10,8 +10,29 @@ System Role:
 
 from __future__ import annotations
 
-from .adapters.cli.main import main as cli_main
-from .composition import build_production
+import sys
+from collections.abc import Sequence
+
+
+def _fast_path(argv: Sequence[str]) -> int | None:
+    """Answer invocations that need neither Click nor configuration.
+
+    ``--version`` is an eager option: Click prints it and exits before the
+    root callback loads config or logging, so answering it here produces the
+    same output without importing the CLI framework.
+
+    Args:
+        argv: Arguments after the program name.
+
+    Returns:
+        Exit code if the invocation was handled, None to fall through to Click.
+    """
+    if list(argv) == ["--version"]:
+        from . import __init__conf__
+
+        sys.stdout.write(f"{__init__conf__.shell_command} version {__init__conf__.version}\n")
+        return 0
+    return None
 
 
 def main() -> int:
@@ -20,6 +41,13 @@ def main() -> int:
     Returns:
         Exit code from CLI execution.
     """
+    fast_exit = _fast_path(sys.argv[1:])
+    if fast_exit is not None:
+        return fast_exit
+
+    from .adapters.cli.main import main as cli_main
+    from .composition import build_production
+
     return cli_main(services_factory=build_production)
 
 
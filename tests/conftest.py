@@ -9,7 +9,9 @@ Centralizes test infrastructure following clean architecture principles:
 from __future__ import annotations
 
 import contextlib
+import importlib
 import os
+import pkgutil
 import re
 import tempfile
 from collections.abc import Callable, Iterator
@@ -639,3 +641,44 @@ def config_cli_context(
         return lambda: test_services
 
     return _create
+
+
+@pytest.fixture
+def stub_stagerunner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, ...]]:
+    """Stub the stagerunner for every command module and record its arguments.
+
+    Points ``Path.cwd`` at ``tmp_path``, resolves every script to a fake path
+    there, and replaces ``execute_script`` in each module under
+    ``bmk.adapters.cli.commands`` with a recorder that succeeds without
+    running anything.
+
+    Args:
+        tmp_path: Pytest temporary directory used as the working directory.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        list[tuple[str, ...]]: The arguments forwarded to each script run, in call order.
+
+    Example:
+        def test_push_forwards_message(
+            cli_runner: CliRunner,
+            stub_stagerunner: list[tuple[str, ...]],
+        ) -> None:
+            cli_runner.invoke(cli, ["push", "fix"])
+            assert stub_stagerunner == [("fix",)]
+    """
+    from bmk.adapters.cli import commands
+
+    calls: list[tuple[str, ...]] = []
+
+    def _fake_execute(script_path: Path, cwd: Path, args: tuple[str, ...], **_kwargs: Any) -> int:
+        calls.append(args)
+        return 0
+
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+    monkeypatch.setattr("bmk.adapters.cli.commands._shared.resolve_script_path", lambda *_: tmp_path / "runner.sh")
+    for module_info in pkgutil.iter_modules(commands.__path__):
+        module = importlib.import_module(f"{commands.__name__}.{module_info.name}")
+        if hasattr(module, "execute_script"):
+            monkeypatch.setattr(module, "execute_script", _fake_execute)
+    return calls
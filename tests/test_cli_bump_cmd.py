@@ -6,10 +6,12 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import click
 import pytest
 from click.testing import CliRunner, Result
 
 from bmk.adapters import cli as cli_mod
+from bmk.adapters.cli.commands.bump_cmd import BUMP_GROUPS
 from bmk.adapters.cli.exit_codes import ExitCode
 
 # =============================================================================
@@ -204,7 +206,7 @@ def test_cli_bump_uses_correct_command_prefix(
         "bmk.adapters.cli.commands._shared.resolve_script_path",
         mock_resolve,
     )
-    monkeypatch.setattr("bmk.adapters.cli.commands.bump_cmd.execute_script", mock_execute)
+    monkeypatch.setattr("bmk.adapters.cli.commands.bump_impl.execute_script", mock_execute)
 
     cli_runner.invoke(cli_mod.cli, [group, subcommand], obj=production_factory)
 
@@ -246,7 +248,7 @@ def test_cli_bump_propagates_script_exit_code(
         mock_resolve,
     )
     monkeypatch.setattr(
-        "bmk.adapters.cli.commands.bump_cmd.execute_script",
+        "bmk.adapters.cli.commands.bump_impl.execute_script",
         mock_execute,
     )
 
@@ -284,7 +286,7 @@ def test_cli_bump_returns_success_when_script_succeeds(
         mock_resolve,
     )
     monkeypatch.setattr(
-        "bmk.adapters.cli.commands.bump_cmd.execute_script",
+        "bmk.adapters.cli.commands.bump_impl.execute_script",
         mock_execute,
     )
 
@@ -349,9 +351,69 @@ def test_cli_bump_aliases_invoke_same_implementation(
         "bmk.adapters.cli.commands._shared.resolve_script_path",
         mock_resolve,
     )
-    monkeypatch.setattr("bmk.adapters.cli.commands.bump_cmd.execute_script", mock_execute)
+    monkeypatch.setattr("bmk.adapters.cli.commands.bump_impl.execute_script", mock_execute)
 
     cli_runner.invoke(cli_mod.cli, [alias_group, alias_cmd], obj=production_factory)
 
     assert len(captured_prefix) == 1
     assert captured_prefix[0] == canonical_prefix
+
+
+# =============================================================================
+# Shared subcommands
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("group_name", ["bump", "bmp", "b"])
+def test_bump_groups_list_all_subcommands(group_name: str) -> None:
+    """Every bump group lists the six subcommands."""
+    group = cli_mod.cli.commands[group_name]
+
+    assert isinstance(group, click.Group)
+    assert group.list_commands(click.Context(group)) == ["m", "ma", "major", "minor", "p", "patch"]
+
+
+@pytest.mark.os_agnostic
+def test_bump_groups_share_subcommand_objects() -> None:
+    """All bump groups resolve a subcommand name to the same command object."""
+    groups = [cli_mod.cli.commands[name] for name in ("bump", "bmp", "b")]
+    resolved = {
+        id(group.get_command(click.Context(group), "major")) for group in groups if isinstance(group, click.Group)
+    }
+
+    assert len(resolved) == 1
+
+
+@pytest.mark.os_agnostic
+def test_bump_group_registry_is_what_the_root_cli_registers() -> None:
+    """BUMP_GROUPS holds exactly the group objects registered on the root CLI."""
+    assert list(BUMP_GROUPS) == ["bump", "bmp", "b"]
+    for name, group in BUMP_GROUPS.items():
+        assert cli_mod.cli.commands[name] is group
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.usefixtures("stub_stagerunner")
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["bump", "major"], "Bumping major version"),
+        (["bmp", "ma"], "Bumping major version (via alias 'ma')"),
+        (["b", "minor"], "Bumping minor version"),
+        (["bump", "p"], "Bumping patch version (via alias 'p')"),
+    ],
+)
+def test_bump_subcommand_logs_alias_suffix_only_for_aliases(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    caplog: pytest.LogCaptureFixture,
+    argv: list[str],
+    message: str,
+) -> None:
+    """Alias subcommands name the alias in the log message; canonical names log no suffix."""
+    with caplog.at_level("INFO", logger="bmk.adapters.cli.commands.bump_impl"):
+        result = cli_runner.invoke(cli_mod.cli, argv, obj=production_factory)
+
+    assert result.exit_code == 0
+    assert [r.getMessage() for r in caplog.records if r.name.endswith("bump_impl")] == [message]
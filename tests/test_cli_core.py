@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -208,3 +210,63 @@ def test_when_logdemo_is_invoked_it_completes_successfully(
 
     assert result.exit_code == 0
     assert "Log demo completed" in result.output
+
+
+@pytest.mark.os_agnostic
+def test_commands_package_exports_only_click_commands() -> None:
+    """Every name in commands.__all__ is a Click command defined in the package."""
+    import click
+
+    from bmk.adapters.cli import commands
+
+    for name in commands.__all__:
+        assert isinstance(getattr(commands, name), click.Command), name
+    assert set(commands.__all__) <= set(dir(commands))
+
+
+@pytest.mark.os_agnostic
+def test_root_group_registers_exactly_the_exported_commands() -> None:
+    """The root group exposes one entry per commands.__all__ export, keyed by command name."""
+    from bmk.adapters.cli import commands
+
+    exported = {getattr(commands, name).name: getattr(commands, name) for name in commands.__all__}
+
+    assert cli_mod.cli.commands == exported
+
+
+@pytest.mark.os_agnostic
+def test_exported_commands_have_unique_names() -> None:
+    """No two exports share a command name, so bulk registration never drops one."""
+    from bmk.adapters.cli import commands
+
+    names = [getattr(commands, export).name for export in commands.__all__]
+
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.os_agnostic
+def test_passthrough_commands_share_one_context_settings_dict() -> None:
+    """Pass-through commands reference the shared settings instead of merged copies."""
+    from bmk.adapters.cli.constants import PASSTHROUGH_CONTEXT_SETTINGS
+
+    for name in ("release", "rel", "r", "run", "test", "t", "testintegration", "testi", "ti"):
+        assert cli_mod.cli.commands[name].context_settings is PASSTHROUGH_CONTEXT_SETTINGS, name
+
+
+@pytest.mark.os_agnostic
+def test_constants_module_loads_without_click() -> None:
+    """The constants module is plain data and never imports Click or Rich."""
+    from bmk.adapters.cli import constants
+
+    probe = (
+        "import importlib.util, sys\n"
+        f"spec = importlib.util.spec_from_file_location('bmk_cli_constants', {constants.__file__!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "spec.loader.exec_module(module)\n"
+        "assert module.TRACEBACK_SUMMARY_LIMIT > 0\n"
+        "loaded = sorted(m for m in sys.modules if m.split('.')[0] in {'click', 'rich', 'rich_click'})\n"
+        "print(','.join(loaded))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ""
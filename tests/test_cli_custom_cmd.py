@@ -1,5 +1,7 @@
 """CLI custom command stories: registration, script discovery, execution, and errors."""
 
+# pyright: reportPrivateUsage=false
+
 from __future__ import annotations
 
 import stat
@@ -81,6 +83,18 @@ def test_validate_command_name_rejects_path_traversal() -> None:
             validate_command_name(bad_name)
 
 
+@pytest.mark.os_agnostic
+def test_validate_command_name_rejects_empty_leading_symbol_and_non_ascii() -> None:
+    """Empty names, names starting with ``-``/``_``, trailing newlines and non-ASCII letters are rejected."""
+    from click import BadParameter
+
+    from bmk.adapters.cli.commands.custom_cmd import validate_command_name
+
+    for bad_name in ("", "-deploy", "_deploy", "deploy\n", "déploy"):
+        with pytest.raises(BadParameter):
+            validate_command_name(bad_name)
+
+
 @pytest.mark.os_agnostic
 def test_cli_custom_rejects_unsafe_command_name(
     cli_runner: CliRunner,
@@ -130,6 +144,41 @@ def test_resolve_override_dir_uses_config_value(
     assert result == custom_dir
 
 
+@pytest.mark.os_agnostic
+def test_resolve_override_dir_warns_only_when_outside_project(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A configured override directory outside cwd logs a warning; one inside does not."""
+    from bmk.adapters.cli.commands.custom_cmd import resolve_override_dir
+
+    project = tmp_path / "project"
+    project.mkdir()
+
+    with caplog.at_level("WARNING", logger="bmk.adapters.cli.commands.custom_cmd"):
+        resolve_override_dir(project, {"override_dir": str(project / "scripts")})
+        assert caplog.records == []
+
+        resolve_override_dir(project, {"override_dir": str(tmp_path / "elsewhere")})
+
+    assert [r.getMessage() for r in caplog.records] == [
+        f"Override directory '{tmp_path / 'elsewhere'}' is outside project tree '{project}'"
+    ]
+
+
+@pytest.mark.os_agnostic
+def test_is_within_does_not_treat_a_sibling_with_the_same_prefix_as_inside(tmp_path: Path) -> None:
+    """``project-other`` is not inside ``project``; the project itself and its children are."""
+    from bmk.adapters.cli.commands.custom_cmd import _is_within
+
+    project = tmp_path / "project"
+
+    assert _is_within(str(project), str(project))
+    assert _is_within(str(project / "scripts" / "deep"), str(project))
+    assert not _is_within(str(tmp_path / "project-other"), str(project))
+    assert not _is_within(str(project / ".." / "elsewhere"), str(project))
+
+
 # ---------------------------------------------------------------------------
 # Script discovery
 # ---------------------------------------------------------------------------
@@ -150,6 +199,37 @@ def test_find_custom_scripts_returns_matching_scripts(tmp_path: Path) -> None:
     assert all("deploy" in p.name for p in result)
 
 
+@pytest.mark.os_agnostic
+def test_find_custom_scripts_matches_the_documented_glob_in_sorted_order(tmp_path: Path) -> None:
+    """Selection and order match ``sorted(dir.glob("{name}_[0-9]*_*.sh"))``."""
+    from bmk.adapters.cli.commands.custom_cmd import find_custom_scripts
+
+    names = (
+        "deploy_10_finish.sh",
+        "deploy_02_upload.sh",
+        "deploy_1a_b_c.sh",
+        "deploy_3_.sh",
+        "deploy_01.sh",
+        "deploy_x1_prepare.sh",
+        "deploy__01_prepare.sh",
+        "deploy_01_prepare.ps1",
+        "deployx_01_prepare.sh",
+        "redeploy_01_prepare.sh",
+    )
+    for name in names:
+        (tmp_path / name).touch()
+
+    result = find_custom_scripts(tmp_path, "deploy")
+
+    assert result == sorted(tmp_path.glob("deploy_[0-9]*_*.sh"))
+    assert [p.name for p in result] == [
+        "deploy_02_upload.sh",
+        "deploy_10_finish.sh",
+        "deploy_1a_b_c.sh",
+        "deploy_3_.sh",
+    ]
+
+
 @pytest.mark.os_agnostic
 def test_find_custom_scripts_returns_empty_for_nonexistent_dir(tmp_path: Path) -> None:
     """Returns empty list when override directory does not exist."""
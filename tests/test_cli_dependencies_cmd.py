@@ -6,6 +6,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import click
 import pytest
 from click.testing import CliRunner, Result
 
@@ -412,3 +413,48 @@ def test_cli_deps_update_flag_equivalent_to_subcommand(
     # Test with subcommand
     cli_runner.invoke(cli_mod.cli, [group, "update"], obj=production_factory)
     assert captured_prefix[-1] == "deps_update"
+
+
+# =============================================================================
+# Shared update subcommands
+# =============================================================================
+
+
+@pytest.mark.os_agnostic
+def test_dependency_groups_share_update_command_objects() -> None:
+    """All dependency groups register the same update/u command objects."""
+    groups = [cli_mod.cli.commands[name] for name in ("dependencies", "deps", "d")]
+
+    for sub in ("update", "u"):
+        resolved = {id(group.commands[sub]) for group in groups if isinstance(group, click.Group)}
+        assert len(resolved) == 1
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["dependencies"], "Checking dependencies"),
+        (["d", "-u"], "Updating dependencies (via 'd')"),
+        (["dependencies", "update"], "Updating dependencies"),
+        (["deps", "u"], "Updating dependencies (via 'deps u')"),
+        (["dependencies", "u"], "Updating dependencies (via alias 'u')"),
+        (["deps", "update"], "Updating dependencies (via 'deps')"),
+        (["d", "update"], "Updating dependencies (via 'd')"),
+        (["d", "u"], "Updating dependencies (via 'd u')"),
+    ],
+)
+@pytest.mark.usefixtures("stub_stagerunner")
+def test_dependency_commands_log_the_invocation_path(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    caplog: pytest.LogCaptureFixture,
+    argv: list[str],
+    message: str,
+) -> None:
+    """Shared callbacks log the group and alias they were invoked through."""
+    with caplog.at_level("INFO", logger="bmk.adapters.cli.commands.dependencies_cmd"):
+        result = cli_runner.invoke(cli_mod.cli, argv, obj=production_factory)
+
+    assert result.exit_code == 0
+    assert [r.getMessage() for r in caplog.records if r.name.endswith("dependencies_cmd")] == [message]
@@ -1,5 +1,7 @@
 """CLI email stories: send-email, send-notification, SMTP overrides, credential overrides."""
 
+# pyright: reportPrivateUsage=false
+
 from __future__ import annotations
 
 from collections.abc import Callable
@@ -73,7 +75,7 @@ def test_when_send_email_is_invoked_with_valid_config_it_sends(
     assert "Email sent successfully" in result.output
     assert len(ctx.spy.sent_emails) == 1
     assert ctx.spy.sent_emails[0]["subject"] == "Test Subject"
-    assert ctx.spy.sent_emails[0]["recipients"] == ["recipient@test.com"]
+    assert ctx.spy.sent_emails[0]["recipients"] == ("recipient@test.com",)
 
 
 @pytest.mark.os_agnostic
@@ -106,7 +108,7 @@ def test_when_send_email_receives_multiple_recipients_it_accepts_them(
     )
 
     assert result.exit_code == 0
-    assert ctx.spy.sent_emails[0]["recipients"] == ["user1@test.com", "user2@test.com"]
+    assert ctx.spy.sent_emails[0]["recipients"] == ("user1@test.com", "user2@test.com")
 
 
 @pytest.mark.os_agnostic
@@ -303,7 +305,7 @@ def test_when_send_notification_receives_multiple_recipients_it_accepts_them(
     )
 
     assert result.exit_code == 0
-    assert ctx.spy.sent_notifications[0]["recipients"] == ["admin1@test.com", "admin2@test.com"]
+    assert ctx.spy.sent_notifications[0]["recipients"] == ("admin1@test.com", "admin2@test.com")
 
 
 @pytest.mark.os_agnostic
@@ -779,3 +781,89 @@ def test_when_send_notification_receives_negative_timeout_it_exits_invalid_argum
 
     assert result.exit_code == 22
     assert "Invalid option value" in result.output or "timeout must be positive" in result.output
+
+
+@pytest.mark.os_agnostic
+def test_apply_validated_overrides_keeps_untouched_fields_and_revalidates() -> None:
+    """Overrides replace only the named fields and still run the model validators."""
+    from pydantic import ValidationError
+
+    from bmk.adapters.cli.commands.email._common import apply_validated_overrides
+    from bmk.adapters.email.config import EmailConfig
+
+    base = EmailConfig(
+        smtp_hosts=["smtp.example.com:587"],
+        from_address="sender@example.com",
+        attachment_allowed_extensions=frozenset({"pdf"}),
+    )
+
+    updated = apply_validated_overrides(base, {"timeout": 5.0, "smtp_username": ""})
+
+    assert updated == EmailConfig.model_validate({**base.model_dump(), "timeout": 5.0, "smtp_username": ""})
+    assert updated.smtp_username is None
+    assert updated.attachment_allowed_extensions == frozenset({"pdf"})
+    with pytest.raises(ValidationError):
+        apply_validated_overrides(base, {"timeout": -1.0})
+
+
+@pytest.mark.os_agnostic
+def test_apply_validated_overrides_returns_base_when_nothing_overridden() -> None:
+    """With no overrides the already-validated config is returned without revalidation."""
+    from bmk.adapters.cli.commands.email._common import apply_validated_overrides
+    from bmk.adapters.email.config import EmailConfig
+
+    base = EmailConfig(smtp_hosts=["smtp.example.com:587"], from_address="sender@example.com")
+
+    assert apply_validated_overrides(base, {}) is base
+
+
+@pytest.mark.os_agnostic
+def test_filter_sentinels_drops_unset_options_and_listifies_tuples() -> None:
+    """None and () are dropped, tuples become lists, other falsy values are kept."""
+    from bmk.adapters.cli.commands.email import filter_sentinels
+
+    assert filter_sentinels(smtp_hosts=(), smtp_username=None, timeout=None) == {}
+    assert filter_sentinels(smtp_hosts=("a:25", "b:25"), use_starttls=False, timeout=0.0, smtp_password="") == {
+        "smtp_hosts": ["a:25", "b:25"],
+        "use_starttls": False,
+        "timeout": 0.0,
+        "smtp_password": "",
+    }
+
+
+@pytest.mark.os_agnostic
+def test_email_commands_get_distinct_smtp_options_in_declared_order() -> None:
+    """The shared decorators give each command its own Option objects, in listed order."""
+    from bmk.adapters.cli.commands.email import cli_send_email, cli_send_notification
+
+    names = [
+        "smtp_hosts",
+        "smtp_username",
+        "smtp_password",
+        "use_starttls",
+        "timeout",
+        "raise_on_missing_attachments",
+        "raise_on_invalid_recipient",
+    ]
+    email_params = [param for param in cli_send_email.params if param.name in names]
+    notification_params = [param for param in cli_send_notification.params if param.name in names]
+
+    assert [param.name for param in email_params] == names
+    assert [param.name for param in notification_params] == names
+    assert all(a is not b for a, b in zip(email_params, notification_params, strict=True))
+
+
+@pytest.mark.os_agnostic
+def test_log_send_email_start_builds_extra_only_when_info_enabled(caplog: pytest.LogCaptureFixture) -> None:
+    """The start record carries its extras at INFO and is skipped entirely above it."""
+    from bmk.adapters.cli.commands.email.send_email import _log_send_email_start, logger
+
+    with caplog.at_level("WARNING", logger=logger.name):
+        _log_send_email_start(["a@example.com"], "Hi", "", ())
+    assert caplog.records == []
+
+    with caplog.at_level("INFO", logger=logger.name):
+        _log_send_email_start(["a@example.com"], "Hi", "<p>Hi</p>", ("a.pdf", "b.pdf"))
+    (record,) = caplog.records
+    assert record.__dict__["has_html"] is True
+    assert record.__dict__["attachment_count"] == 2
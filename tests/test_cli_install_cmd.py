@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -93,6 +94,26 @@ def test_cli_install_overwrites_managed_makefile(
     assert content.startswith("# BMK MAKEFILE")
 
 
+@pytest.mark.os_posix
+@pytest.mark.skipif(sys.platform == "win32", reason="Requires POSIX permission bits")
+def test_cli_install_keeps_permissions_of_updated_makefile(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Updating a managed Makefile replaces its content, not its permission bits."""
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+    makefile = tmp_path / "Makefile"
+    makefile.write_text("# BMK MAKEFILE V0.9\nold content\n", encoding="utf-8")
+    makefile.chmod(0o600)
+
+    result: Result = cli_runner.invoke(cli_mod.cli, ["install"], obj=production_factory)
+
+    assert result.exit_code == 0
+    assert makefile.stat().st_mode & 0o777 == 0o600
+
+
 # =============================================================================
 # Skip custom Makefile tests
 # =============================================================================
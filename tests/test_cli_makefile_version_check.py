@@ -12,7 +12,12 @@ import pytest
 from click.testing import CliRunner, Result
 
 from bmk.adapters import cli as cli_mod
-from bmk.adapters.cli.commands.install_cmd import _extract_version
+from bmk.adapters.cli.commands.install_cmd import (
+    _FIRST_LINE_LIMIT,
+    _bundled_version,
+    _extract_version,
+    _read_first_line,
+)
 
 # =============================================================================
 # _extract_version unit tests
@@ -22,25 +27,76 @@ from bmk.adapters.cli.commands.install_cmd import _extract_version
 @pytest.mark.os_agnostic
 def test_extract_version_parses_sentinel() -> None:
     """Extracts version string from a valid sentinel line."""
-    assert _extract_version("# BMK MAKEFILE 1.0.0") == "1.0.0"
+    assert _extract_version(b"# BMK MAKEFILE 1.0.0") == "1.0.0"
 
 
 @pytest.mark.os_agnostic
 def test_extract_version_parses_multipart_version() -> None:
     """Extracts version with extra whitespace."""
-    assert _extract_version("# BMK MAKEFILE 2.3.4") == "2.3.4"
+    assert _extract_version(b"# BMK MAKEFILE 2.3.4") == "2.3.4"
 
 
 @pytest.mark.os_agnostic
 def test_extract_version_returns_none_for_custom() -> None:
     """Returns None for a non-sentinel line."""
-    assert _extract_version("# My custom Makefile") is None
+    assert _extract_version(b"# My custom Makefile") is None
+
+
+@pytest.mark.os_agnostic
+def test_extract_version_ignores_undecodable_custom_line() -> None:
+    """A non-UTF-8 custom first line is rejected without being decoded."""
+    assert _extract_version(b"# \xff\xfe custom") is None
 
 
 @pytest.mark.os_agnostic
 def test_extract_version_returns_none_for_sentinel_without_version() -> None:
     """Returns None when sentinel exists but no version follows."""
-    assert _extract_version("# BMK MAKEFILE") is None
+    assert _extract_version(b"# BMK MAKEFILE") is None
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"# BMK MAKEFILE 1.0.0\nall:\n", b"# BMK MAKEFILE 1.0.0"),
+        (b"# BMK MAKEFILE 1.0.0\r\nall:\r\n", b"# BMK MAKEFILE 1.0.0"),
+        (b"# BMK MAKEFILE 1.0.0", b"# BMK MAKEFILE 1.0.0"),
+        (b"", b""),
+    ],
+)
+def test_read_first_line_strips_line_ending(tmp_path: Path, content: bytes, expected: bytes) -> None:
+    """Only the first line is returned, without its line ending."""
+    makefile = tmp_path / "Makefile"
+    makefile.write_bytes(content)
+
+    assert _read_first_line(makefile) == expected
+
+
+@pytest.mark.os_agnostic
+def test_read_first_line_returns_none_for_missing_file(tmp_path: Path) -> None:
+    """A missing file is reported as None rather than raising."""
+    assert _read_first_line(tmp_path / "Makefile") is None
+
+
+@pytest.mark.os_agnostic
+def test_read_first_line_is_bounded(tmp_path: Path) -> None:
+    """A huge first line is truncated instead of being read in full."""
+    makefile = tmp_path / "Makefile"
+    makefile.write_text("#" * 10_000 + "\nall:\n", encoding="utf-8")
+
+    assert _read_first_line(makefile) == b"#" * _FIRST_LINE_LIMIT
+
+
+@pytest.mark.os_agnostic
+def test_bundled_version_is_read_once_per_path(tmp_path: Path) -> None:
+    """The bundled version is cached; a missing file yields None."""
+    bundled = tmp_path / "Makefile"
+    bundled.write_text("# BMK MAKEFILE 9.9.9\n", encoding="utf-8")
+
+    assert _bundled_version(bundled) == "9.9.9"
+    bundled.write_text("# BMK MAKEFILE 0.0.0\n", encoding="utf-8")
+    assert _bundled_version(bundled) == "9.9.9"
+    assert _bundled_version(tmp_path / "missing") is None
 
 
 # =============================================================================
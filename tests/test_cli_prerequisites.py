@@ -34,13 +34,13 @@ def _fake_which_some_missing(name: str) -> str | None:
 def _fake_psscriptanalyzer_found(
     cmd: list[str],
     *,
-    capture_output: bool = False,
-    text: bool = False,
+    stdout: Any = None,
+    stderr: Any = None,
     check: bool = False,
     timeout: int | None = None,
-) -> subprocess.CompletedProcess[str]:
-    """Simulate PSScriptAnalyzer module available."""
-    return subprocess.CompletedProcess(cmd, returncode=0, stdout="PSScriptAnalyzer\n", stderr="")
+) -> subprocess.CompletedProcess[bytes]:
+    """Simulate PSScriptAnalyzer module available (binary-mode output)."""
+    return subprocess.CompletedProcess(cmd, returncode=0, stdout=b"PSScriptAnalyzer\n", stderr=None)
 
 
 @pytest.mark.os_agnostic
@@ -234,3 +234,48 @@ def test_install_shows_prerequisites_even_when_makefile_skipped(
     assert result.exit_code != 0
     assert "skipping" in result.output
     assert "Prerequisites:" in result.output
+
+
+@pytest.mark.os_agnostic
+def test_check_prerequisites_looks_up_pwsh_only_once() -> None:
+    """The pwsh PATH lookup is reused for the PSScriptAnalyzer probe."""
+    with (
+        patch("bmk.adapters.cli.commands._prerequisites.sys") as mock_sys,
+        patch("bmk.adapters.cli.commands._prerequisites.shutil") as mock_shutil,
+        patch("bmk.adapters.cli.commands._prerequisites.subprocess") as mock_subprocess,
+    ):
+        mock_sys.platform = "linux"
+        mock_shutil.which.side_effect = _fake_which_all_found
+        mock_subprocess.run.side_effect = _fake_psscriptanalyzer_found
+        mock_subprocess.TimeoutExpired = subprocess.TimeoutExpired
+
+        check_prerequisites()
+
+    looked_up = [call.args[0] for call in mock_shutil.which.call_args_list]
+    assert looked_up.count("pwsh") == 1
+    assert mock_subprocess.run.call_args.args[0][0] == "/usr/bin/pwsh"
+
+
+@pytest.mark.os_agnostic
+def test_psscriptanalyzer_found_on_module_path_skips_pwsh_launch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A PSScriptAnalyzer folder on PSModulePath is detected without running pwsh."""
+    (tmp_path / "PSScriptAnalyzer" / "1.22.0").mkdir(parents=True)
+    monkeypatch.setenv("PSModulePath", str(tmp_path))
+
+    with (
+        patch("bmk.adapters.cli.commands._prerequisites.sys") as mock_sys,
+        patch("bmk.adapters.cli.commands._prerequisites.shutil") as mock_shutil,
+        patch("bmk.adapters.cli.commands._prerequisites.subprocess") as mock_subprocess,
+    ):
+        mock_sys.platform = "linux"
+        mock_shutil.which.side_effect = _fake_which_all_found
+        mock_subprocess.TimeoutExpired = subprocess.TimeoutExpired
+
+        results = check_prerequisites()
+
+    by_name = {r.name: r for r in results}
+    assert by_name["PSScriptAnalyzer"].found is True
+    mock_subprocess.run.assert_not_called()
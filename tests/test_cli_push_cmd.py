@@ -89,3 +89,18 @@ def test_cli_push_shows_error_message_when_script_missing(
     assert "Error: Push script" in result.output
     assert "not found" in result.output
     assert "Searched locations:" in result.output
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("name", ["push", "psh", "p"])
+def test_cli_push_aliases_forward_message_to_script(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    stub_stagerunner: list[tuple[str, ...]],
+    name: str,
+) -> None:
+    """Every alias runs the push script with the message parts."""
+    result: Result = cli_runner.invoke(cli_mod.cli, [name, "fix", "bug"], obj=production_factory)
+
+    assert result.exit_code == 0
+    assert stub_stagerunner == [("fix", "bug")]
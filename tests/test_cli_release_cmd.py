@@ -100,3 +100,18 @@ def test_cli_release_shows_error_message_when_script_missing(
     assert "Error: Release script" in result.output
     assert "not found" in result.output
     assert "Searched locations:" in result.output
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("name", ["release", "rel", "r"])
+def test_cli_release_aliases_forward_args_to_script(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    stub_stagerunner: list[tuple[str, ...]],
+    name: str,
+) -> None:
+    """Every alias runs the release script with the passthrough arguments."""
+    result: Result = cli_runner.invoke(cli_mod.cli, [name, "--dry-run"], obj=production_factory)
+
+    assert result.exit_code == 0
+    assert stub_stagerunner == [("--dry-run",)]
@@ -1,5 +1,7 @@
 """CLI test command stories: script resolution, execution, and argument passing."""
 
+# pyright: reportPrivateUsage=false
+
 from __future__ import annotations
 
 import os
@@ -13,26 +15,38 @@ import pytest
 from click.testing import CliRunner, Result
 
 from bmk.adapters import cli as cli_mod
+from bmk.adapters.cli.commands import _shared
 from bmk.adapters.cli.commands._shared import (
+    SCRIPT_NAME,
+    _script_name_for_platform,
     execute_script,
     get_script_name,
+    is_bundled_script,
+    normalize_returncode,
+    require_script_path,
     resolve_script_path,
+    run_stagerunner,
 )
 from bmk.adapters.cli.exit_codes import ExitCode
 
 
 @pytest.mark.os_agnostic
-def test_get_script_name_returns_sh_on_non_windows(monkeypatch: pytest.MonkeyPatch) -> None:
-    """get_script_name returns _btx_stagerunner.sh on Linux/macOS."""
-    monkeypatch.setattr(sys, "platform", "linux")
-    assert get_script_name() == "_btx_stagerunner.sh"
+def test_script_name_for_platform_returns_sh_on_non_windows() -> None:
+    """Linux/macOS map to _btx_stagerunner.sh."""
+    assert _script_name_for_platform("linux") == "_btx_stagerunner.sh"
+    assert _script_name_for_platform("darwin") == "_btx_stagerunner.sh"
+
+
+@pytest.mark.os_agnostic
+def test_script_name_for_platform_returns_ps1_on_windows() -> None:
+    """Windows maps to _btx_stagerunner.ps1."""
+    assert _script_name_for_platform("win32") == "_btx_stagerunner.ps1"
 
 
 @pytest.mark.os_agnostic
-def test_get_script_name_returns_ps1_on_windows(monkeypatch: pytest.MonkeyPatch) -> None:
-    """get_script_name returns _btx_stagerunner.ps1 on Windows."""
-    monkeypatch.setattr(sys, "platform", "win32")
-    assert get_script_name() == "_btx_stagerunner.ps1"
+def test_get_script_name_returns_import_time_constant() -> None:
+    """get_script_name returns SCRIPT_NAME, fixed for the running platform."""
+    assert get_script_name() == SCRIPT_NAME == _script_name_for_platform(sys.platform)
 
 
 @pytest.mark.os_agnostic
@@ -67,6 +81,62 @@ def test_resolve_script_path_returns_none_when_not_found(tmp_path: Path) -> None
     assert result is None
 
 
+@pytest.mark.os_agnostic
+def test_is_bundled_script_reflects_the_bundled_directory() -> None:
+    """Both stagerunners ship in the bundled directory; unknown names do not."""
+    assert is_bundled_script("_btx_stagerunner.sh")
+    assert is_bundled_script("_btx_stagerunner.ps1")
+    assert not is_bundled_script("no_such_script.sh")
+    assert is_bundled_script(SCRIPT_NAME) == (_shared.BUNDLED_DIR / SCRIPT_NAME).is_file()
+
+
+@pytest.mark.os_agnostic
+def test_require_script_path_sees_new_local_override(tmp_path: Path) -> None:
+    """A local override script added after a bundled lookup is picked up."""
+    bundled = require_script_path("_btx_stagerunner.sh", tmp_path, "Test")
+
+    override_dir = tmp_path / "bmk_makescripts"
+    override_dir.mkdir()
+    local_script = override_dir / "_btx_stagerunner.sh"
+    local_script.write_text("#!/bin/bash\necho local")
+
+    assert bundled != local_script
+    assert require_script_path("_btx_stagerunner.sh", tmp_path, "Test") == local_script
+
+
+@pytest.mark.os_agnostic
+def test_run_stagerunner_passes_prefix_args_and_options_to_executor(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """run_stagerunner resolves the script in cwd and forwards prefix, args and extra options."""
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+    calls: list[tuple[Path, Path, tuple[str, ...], dict[str, Any]]] = []
+
+    def fake_execute(script_path: Path, cwd: Path, args: tuple[str, ...], **kwargs: Any) -> int:
+        calls.append((script_path, cwd, args, kwargs))
+        return 0
+
+    run_stagerunner("Run", "run", ("--flag",), execute=fake_execute, output_format="text")
+
+    assert len(calls) == 1
+    script_path, cwd, args, kwargs = calls[0]
+    assert script_path.name == SCRIPT_NAME
+    assert cwd == tmp_path
+    assert args == ("--flag",)
+    assert kwargs == {"command_prefix": "run", "output_format": "text"}
+
+
+@pytest.mark.os_agnostic
+def test_run_stagerunner_exits_with_script_failure_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A non-zero executor result becomes the SystemExit code."""
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_stagerunner("Build", "bld", execute=lambda *_args, **_kwargs: 3)
+
+    assert exc_info.value.code == 3
+
+
 @pytest.mark.os_agnostic
 def test_execute_script_uses_pwsh_for_ps1(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """PowerShell scripts are invoked with pwsh."""
@@ -124,6 +194,13 @@ def test_execute_script_runs_shell_script_directly(tmp_path: Path, monkeypatch:
     assert captured_env[0].get("BMK_COMMAND_PREFIX") == "test"
 
 
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize(("code", "expected"), [(0, 0), (1, 1), (255, 255), (-2, 130), (-9, 137), (-15, 143)])
+def test_normalize_returncode_maps_signals_to_128_plus_n(code: int, expected: int) -> None:
+    """Non-negative codes pass through; signal codes -N become 128+N."""
+    assert normalize_returncode(code) == expected
+
+
 @pytest.mark.os_agnostic
 def test_execute_script_returns_exit_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Returns the script's exit code."""
@@ -211,6 +288,27 @@ def test_cli_test_shows_error_message_when_script_missing(
     assert "Searched locations:" in result.output
 
 
+@pytest.mark.os_agnostic
+def test_cli_test_error_lists_real_bundled_location(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The bundled search location printed on error is the real makescripts dir."""
+    monkeypatch.setattr(Path, "cwd", lambda: tmp_path)
+    monkeypatch.setattr(
+        "bmk.adapters.cli.commands._shared.resolve_script_path",
+        _mock_resolve_none,
+    )
+
+    result: Result = cli_runner.invoke(cli_mod.cli, ["test"], obj=production_factory)
+
+    bundled = resolve_script_path(get_script_name(), tmp_path)
+    assert bundled is not None
+    assert f"  - {bundled}" in result.output
+
+
 @pytest.mark.os_agnostic
 def test_cli_test_passes_cwd_as_first_argument(
     cli_runner: CliRunner,
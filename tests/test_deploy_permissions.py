@@ -354,6 +354,29 @@ def test_cli_deploy_dir_mode_parses_octal_with_prefix(
     assert captured[0].dir_mode == 0o750
 
 
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("mode", ["0O750", "7_5_0", " 750", "0o7_50"])
+def test_cli_deploy_dir_mode_accepts_int_octal_spellings(
+    cli_runner: CliRunner,
+    tmp_path: Path,
+    inject_deploy_with_permission_capture: Callable[[Path, list[CapturedDeployArgs]], Callable[[], Any]],
+    mode: str,
+) -> None:
+    """--dir-mode accepts the spellings int(..., 8) accepts: upper-case prefix, underscores, padding."""
+    deployed_path = tmp_path / "config.toml"
+    deployed_path.touch()
+    captured: list[CapturedDeployArgs] = []
+
+    factory = inject_deploy_with_permission_capture(deployed_path, captured)
+
+    result: Result = cli_runner.invoke(
+        cli_mod.cli, ["config-deploy", "--target", "user", "--dir-mode", mode], obj=factory
+    )
+
+    assert result.exit_code == 0
+    assert captured[0].dir_mode == 0o750
+
+
 @pytest.mark.os_agnostic
 def test_cli_deploy_file_mode_parses_octal(
     cli_runner: CliRunner,
@@ -404,6 +427,22 @@ def test_cli_deploy_invalid_octal_file_mode_rejected(
     assert "Invalid octal mode" in result.output
 
 
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("mode", ["", "0o", "-750", "+750", "758", "7__50"])
+def test_cli_deploy_malformed_octal_mode_rejected(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    mode: str,
+) -> None:
+    """Signs, non-octal digits, a bare prefix and misplaced underscores are rejected."""
+    result: Result = cli_runner.invoke(
+        cli_mod.cli, ["config-deploy", "--target", "user", "--dir-mode", mode], obj=production_factory
+    )
+
+    assert result.exit_code != 0
+    assert "Invalid octal mode" in result.output
+
+
 @pytest.mark.os_agnostic
 def test_cli_deploy_both_mode_options_passed(
     cli_runner: CliRunner,
@@ -518,3 +557,19 @@ def test_deploy_configuration_passes_mode_overrides_to_library(
     assert len(captured_kwargs) == 1
     assert captured_kwargs[0]["dir_mode"] == 0o750
     assert captured_kwargs[0]["file_mode"] == 0o640
+
+
+@pytest.mark.os_agnostic
+@pytest.mark.parametrize("value", ["8", "758", "0o", "", "0x1ff", "-750"])
+def test_cli_deploy_octal_parser_rejects_non_octal_digits(
+    cli_runner: CliRunner,
+    production_factory: Callable[[], Any],
+    value: str,
+) -> None:
+    """Mode strings with no digits or non-octal characters are rejected."""
+    result: Result = cli_runner.invoke(
+        cli_mod.cli, ["config-deploy", "--target", "user", "--dir-mode", value], obj=production_factory
+    )
+
+    assert result.exit_code != 0
+    assert "Invalid octal mode" in result.output
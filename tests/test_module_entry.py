@@ -8,6 +8,7 @@ import subprocess
 import sys
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import lib_cli_exit_tools
 import pytest
@@ -148,6 +149,32 @@ def test_module_entry_subprocess_version() -> None:
     assert __init__conf__.version in result.stdout
 
 
+@pytest.mark.os_agnostic
+def test_module_entry_version_skips_cli_and_logging_imports() -> None:
+    """`python -m bmk --version` answers without importing Click, config or logging."""
+    probe = (
+        "import runpy, sys\n"
+        "sys.argv = ['bmk', '--version']\n"
+        "try:\n"
+        "    runpy.run_module('bmk', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('click', 'rich_click', 'lib_layered_config', 'lib_log_rich')\n"
+        "print(sorted(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        timeout=30,
+        check=False,
+        env=_get_subprocess_env(),
+        encoding="utf-8",
+        errors="replace",
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
 @pytest.mark.os_agnostic
 def test_entry_main_invokes_cli_with_help(
     monkeypatch: pytest.MonkeyPatch,
@@ -184,3 +211,22 @@ def test_entry_main_returns_nonzero_on_error(
     plain_err = strip_ansi(capsys.readouterr().err)
     assert exit_code != 0
     assert "RuntimeError" in plain_err or "I should fail" in plain_err
+
+
+@pytest.mark.os_agnostic
+def test_entry_main_version_fast_path_matches_click_output(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    production_factory: Callable[[], Any],
+) -> None:
+    """entry.main() answers --version itself with Click's exact message."""
+    monkeypatch.setattr(sys, "argv", ["bmk", "--version"])
+    fast_exit = entry.main()
+    fast_out = capsys.readouterr().out
+
+    click_exit = cli_mod.main(["--version"], services_factory=production_factory)
+    click_out = capsys.readouterr().out
+
+    assert fast_exit == click_exit == 0
+    assert fast_out == click_out
+    assert __init__conf__.version in fast_out